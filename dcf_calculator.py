@@ -3,10 +3,20 @@ DCF (Discounted Cash Flow) Calculator Module
 Fetches financial data from SEC XBRL filings and calculates company valuation
 """
 
+import functools
+import logging
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from datetime import date
+from pathlib import Path
 import yfinance as yf
+from yfinance.exceptions import YFException
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+from dcf_core import dcf_grid, dcf_projection
 
 try:
     from edgartools import Company
@@ -16,6 +26,251 @@ except ImportError:
     print("Warning: edgartools not installed. Install with: pip install edgartools")
     print("Falling back to yfinance for financial data.")
 
+log = logging.getLogger(__name__)
+
+# What a failed yfinance fetch raises: transport errors (curl_cffi's and requests' both
+# subclass OSError), yfinance's own errors (rate limiting etc.) and malformed responses
+_FETCH_ERRORS = (OSError, YFException, KeyError, ValueError)
+
+# Cash flow row names for operating cash flow and capital expenditures (yfinance and SEC XBRL)
+_OPERATING_CF_KEYS = (
+    'Operating Cash Flow',
+    'Total Cash From Operating Activities',
+    'NetCashProvidedByUsedInOperatingActivities',  # SEC XBRL tag
+    'CashProvidedByUsedInOperatingActivities',
+    'CashFromOperatingActivities',
+    'OperatingActivitiesCashFlow',
+)
+_CAPEX_KEYS = (
+    'Capital Expenditure',
+    'Capital Expenditures',
+    'PaymentsForAcquisitionOfPropertyPlantAndEquipment',  # SEC XBRL tag
+    'PurchaseOfPropertyPlantAndEquipment',
+    'CapitalExpenditures',
+    'Capex',
+)
+# Balance sheet rows read for debt and cash, looked up together
+_BALANCE_SHEET_ROWS = ['Total Debt', 'Long Term Debt', 'Current Debt', 'Cash And Cash Equivalents']
+
+# Keyword fallbacks, matched against lowercased row names (lookaheads so word order doesn't matter)
+_OPERATING_CF_RE = re.compile(r'^(?=.*(?:operating|cashprovidedby))(?=.*activit)|^(?=.*netcash)(?=.*operating)')
+_CAPEX_RE = re.compile(r'^(?=.*capital)(?=.*expenditure)|^(?=.*property)(?=.*plant)(?=.*equipment)|capex'
+                       r'|^(?=.*payment)(?=.*acquisition)(?=.*property)')
+
+# Number of periods kept per statement (FCF history uses 5 years, everything else the latest)
+_KEEP_PERIODS = 5
+
+# Axis labels that look like a 201x/202x date or a fiscal quarter
+_DATEISH_RE = re.compile(r'20[12]|Q[1-4]')
+
+# Network responses are cached on disk: market data for the rest of the day,
+# financial statements (which only change with new filings) for the rest of the quarter
+CACHE_DIR = Path(__file__).resolve().parent / ".dcf_cache"
+# Anything a ticker may contain that isn't safe in a cache file name
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Z0-9.-]')
+
+
+def _disk_cached(fetcher):
+    """Cache a fetcher(ticker, period) result on disk, keyed by ticker, fetcher name and period (day or quarter)"""
+    name = fetcher.__name__.lstrip('_')
+    
+    @functools.wraps(fetcher)
+    def wrapper(ticker: str, period: str):
+        # Tickers are user input: keep the file name inside CACHE_DIR (e.g. 'BRK/B' -> 'BRK_B')
+        prefix = f"{_UNSAFE_FILENAME_RE.sub('_', ticker.upper())}_{name}_"
+        path = CACHE_DIR / f"{prefix}{period}.pkl"
+        if path.exists():
+            try:
+                return pd.read_pickle(path)
+            except Exception:
+                log.warning(f"Ignoring unreadable cache file {path}", exc_info=True)
+        
+        result = fetcher(ticker, period)
+        if result is not None and _write_cache(path, result):
+            _prune_cache(prefix, path)
+        return result
+    
+    return wrapper
+
+
+def _write_cache(path: Path, result) -> bool:
+    """Pickle result to path; a failed write is logged (returning False) and never affects the fetched result"""
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        # Write to a temp file first so concurrent readers never see a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        pd.to_pickle(result, tmp_path)
+        os.replace(tmp_path, path)
+        tmp_path = None
+        return True
+    except Exception:
+        # Unpicklable results raise more than OSError; the data is still good, just not cached
+        log.warning(f"Could not write cache file {path}", exc_info=True)
+        return False
+    finally:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+def _prune_cache(prefix: str, keep: Path):
+    """Delete the cache files of earlier periods for the same ticker and fetcher"""
+    for old in CACHE_DIR.glob(f"{prefix}*.pkl"):
+        # Periods ('2024-10-15', '2024Q3') have no '_', so this skips longer fetcher names
+        if old != keep and '_' not in old.name[len(prefix):]:
+            try:
+                old.unlink()
+            except OSError:
+                log.warning(f"Could not remove stale cache file {old}", exc_info=True)
+
+
+
+def _quarter_key(day: date) -> str:
+    """Calendar quarter label for a date, e.g. '2024Q3'"""
+    return f"{day.year}Q{(day.month - 1) // 3 + 1}"
+
+
+@_disk_cached
+def _fetch_info(ticker: str, day: str) -> Optional[Dict]:
+    """Full market data (current price, beta, market cap, etc.) from yfinance - slow"""
+    info = yf.Ticker(ticker).info
+    return dict(info) if info else None
+
+
+@_disk_cached
+def _fetch_fast_info(ticker: str, day: str) -> Optional[Dict]:
+    """Price, market cap and share count from yfinance's lightweight fast_info"""
+    fast_info = yf.Ticker(ticker).fast_info
+    info = {
+        'marketCap': fast_info.market_cap,
+        'sharesOutstanding': fast_info.shares,
+        'currentPrice': fast_info.last_price,
+    }
+    # Leave missing fields out so info.get(key, default) falls back as it does for .info
+    info = {key: value for key, value in info.items() if value is not None}
+    return info or None
+
+
+@functools.lru_cache(maxsize=1024)
+def _company(ticker: str):
+    """Shared edgartools Company per ticker (avoids repeating its per-instance setup)"""
+    return Company(ticker)
+
+
+@_disk_cached
+def _fetch_10k_statements(ticker: str, quarter: str) -> Optional[Dict[str, pd.DataFrame]]:
+    """Raw statements from the latest 10-K filing, or None if there is no usable filing"""
+    company = _company(ticker)
+    if hasattr(company, 'latest'):
+        # Newer edgartools: fetch just the most recent 10-K instead of the whole filing list
+        filing = company.latest("10-K")
+    else:
+        filings = company.get_filings(form="10-K")
+        filing = filings.latest(1) if filings and len(filings) > 0 else None
+    if not filing:
+        log.warning(f"No 10-K filings found, falling back to yfinance for {ticker}")
+        return None
+    
+    tenk = filing.obj()
+    if not tenk or not hasattr(tenk, 'financials'):
+        log.warning(f"No financials found in 10-K filing, falling back to yfinance for {ticker}")
+        return None
+    
+    # Get financial statements - edgartools returns DataFrames
+    # These may have dates as index or columns, we'll normalize
+    financials_obj = tenk.financials
+    statements = {
+        'balance_sheet': financials_obj.get_balance_sheet(),
+        'income_statement': financials_obj.get_income_statement(),
+        'cashflow': financials_obj.get_cash_flow_statement(),
+    }
+    # Only DataFrames are usable (and picklable for the cache)
+    return {key: df if isinstance(df, pd.DataFrame) else None for key, df in statements.items()}
+
+
+@_disk_cached
+def _fetch_yf_statements(ticker: str, quarter: str) -> Optional[Dict[str, pd.DataFrame]]:
+    """Financial statements from yfinance, or None if nothing came back"""
+    stock = yf.Ticker(ticker)
+    statements = {
+        'financials': stock.financials,
+        'cashflow': stock.cashflow,
+        'balance_sheet': stock.balance_sheet,
+    }
+    if all(df is None or len(df.columns) == 0 for df in statements.values()):
+        return None
+    return statements
+
+
+def _is_period_axis(axis: pd.Index) -> bool:
+    """Whether an axis holds dates/periods, judged from its dtype alone"""
+    return pd.api.types.is_datetime64_any_dtype(axis) or isinstance(axis.dtype, pd.PeriodDtype)
+
+
+def _normalize_dataframe(df):
+    """Convert SEC format to yfinance-like format (dates as columns, accounts as rows)"""
+    if df is None or not isinstance(df, pd.DataFrame) or len(df) == 0:
+        return None
+    
+    # edgartools typically returns: account names as index, dates as columns
+    # This matches yfinance format, so we might not need to transpose
+    # Typed date axes are decided from metadata; transpose() is a view for single-dtype frames
+    if _is_period_axis(df.columns):
+        return df
+    if _is_period_axis(df.index):
+        df = df.transpose()
+    else:
+        # Object-typed axes: check if the first label looks like a date (e.g., '2023-09-30' format)
+        if len(df.columns) > 0:
+            first_col_sample = str(df.columns[0])[:10]
+            # If columns look like dates or periods, keep as is
+            if _DATEISH_RE.search(first_col_sample):
+                return df
+        
+        # If index looks like dates, transpose
+        if len(df.index) > 0:
+            first_idx_sample = str(df.index[0])[:10]
+            if _DATEISH_RE.search(first_idx_sample):
+                df = df.transpose()
+    
+    # Ensure we have columns
+    if len(df.columns) > 0 and len(df.index) > 0:
+        return df
+    return None
+
+
+def _latest_periods(df, periods: int = _KEEP_PERIODS):
+    """Keep only the most recent periods (columns) of a statement, newest first"""
+    if not isinstance(df, pd.DataFrame) or df.shape[1] <= periods:
+        return df
+    if _is_period_axis(df.columns):
+        df = df.sort_index(axis=1, ascending=False)
+    elif all(_DATEISH_RE.search(str(col)) for col in df.columns):
+        df = df[sorted(df.columns, key=str, reverse=True)]
+    else:
+        return df  # Can't tell which columns are periods, keep everything
+    return df.iloc[:, :periods].copy()
+
+
+class _StatementArrays(NamedTuple):
+    """Plain-array copy of a statement for the numeric code paths"""
+    source: pd.DataFrame
+    values: np.ndarray            # float64, rows x periods
+    rows: Dict[object, int]       # row name -> position (first occurrence wins)
+    columns: pd.Index
+
+
+def _statement_arrays(df: pd.DataFrame) -> _StatementArrays:
+    """Snapshot a statement as a float64 array plus a row-name lookup"""
+    numeric = df if all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes) \
+        else df.apply(pd.to_numeric, errors='coerce')
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    rows = {}
+    for i, name in enumerate(df.index):
+        rows.setdefault(name, i)
+    return _StatementArrays(df, values, rows, df.columns)
+
 
 class DCFCalculator:
     """Calculates DCF valuation for a given stock ticker"""
@@ -30,105 +285,132 @@ class DCFCalculator:
         self.balance_sheet = None
         self.use_sec_data = EDGARTOOLS_AVAILABLE
         
-    def fetch_data(self) -> Tuple[bool, str]:
-        """Fetch all necessary financial data from SEC filings (or Yahoo Finance as fallback)"""
+        # Per-instance memoization (results only depend on the fetched statements)
+        self._fcf_cache: Dict[int, pd.Series] = {}
+        self._growth_cache: Dict[str, float] = {}
+        self._wacc_cache: Dict[Tuple[float, float], float] = {}
+        self._arrays: Dict[str, _StatementArrays] = {}
+    
+    def _clear_memo(self):
+        """Forget memoized results (called whenever statements are (re)fetched)"""
+        self._fcf_cache.clear()
+        self._growth_cache.clear()
+        self._wacc_cache.clear()
+        self._arrays.clear()
+    
+    @classmethod
+    def clear_cache(cls):
+        """Delete all cached network responses"""
+        _company.cache_clear()
+        if CACHE_DIR.exists():
+            for path in CACHE_DIR.iterdir():
+                if path.suffix in ('.pkl', '.tmp'):
+                    path.unlink(missing_ok=True)
+    
+    @classmethod
+    def fetch_many(cls, tickers: Iterable[str], max_workers: int = 8, timeout: Optional[float] = None,
+                   need_beta: bool = True) -> Dict[str, Tuple["DCFCalculator", bool, str]]:
+        """
+        Fetch data for several tickers concurrently
+        
+        Network calls are I/O-bound and release the GIL, so a thread pool is enough.
+        timeout is an overall deadline in seconds for the whole batch (None waits for every
+        ticker); tickers still unfinished when it passes are reported as timed out.
+        need_beta is passed on to fetch_data.
+        Returns dictionary mapping each ticker to (calculator, success, message).
+        """
+        calculators = [cls(ticker) for ticker in tickers]
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {executor.submit(calc.fetch_data, need_beta): calc for calc in calculators}
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                calc = futures[future]
+                try:
+                    success, message = future.result()
+                except Exception as e:
+                    log.warning(calc.ticker, exc_info=True)
+                    success, message = False, f"Error fetching data: {str(e)}"
+                results[calc.ticker] = (calc, success, message)
+        except FuturesTimeoutError:
+            for future, calc in futures.items():
+                if calc.ticker not in results:
+                    log.warning(f"Timed out fetching data for {calc.ticker}")
+                    results[calc.ticker] = (calc, False, "Timed out fetching data")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return {calc.ticker: results[calc.ticker] for calc in calculators}
+        
+    def fetch_data(self, need_beta: bool = True) -> Tuple[bool, str]:
+        """
+        Fetch all necessary financial data from SEC filings (or Yahoo Finance as fallback)
+        
+        need_beta=False is for callers that supply their own discount rate: market data then
+        comes from yfinance's cheaper fast_info (price, market cap and shares only), so
+        calculate_wacc would assume a beta of 1 and a 25% tax rate.
+        """
+        today = date.today().isoformat()
+        quarter = _quarter_key(date.today())
+        self._clear_memo()
         try:
             # Always get market data from yfinance (current price, beta, market cap, etc.)
             try:
-                self.info = self.stock.info
+                self.info = None if need_beta else _fetch_fast_info(self.ticker, today)
+                if self.info is None:
+                    self.info = _fetch_info(self.ticker, today)
                 if not self.info or len(self.info) == 0:
                     return False, "Could not fetch market data from yfinance"
-            except Exception as e:
+            except _FETCH_ERRORS as e:
+                log.warning(self.ticker, exc_info=True)
                 return False, f"Error fetching market data: {str(e)}"
             
             # Try to get financial statements from SEC XBRL filings first
             if self.use_sec_data:
                 try:
-                    company = Company(self.ticker)
-                    filings = company.get_filings(form="10-K")
+                    statements = _fetch_10k_statements(self.ticker, quarter)
                     
-                    if filings and len(filings) > 0:
-                        tenk = filings.latest(1).obj()
+                    if statements is not None:
+                        self.balance_sheet = _normalize_dataframe(statements['balance_sheet'])
+                        self.financials = _normalize_dataframe(statements['income_statement'])
+                        self.cashflow = _normalize_dataframe(statements['cashflow'])
                         
-                        if tenk and hasattr(tenk, 'financials'):
-                            financials_obj = tenk.financials
-                            
-                            # Get financial statements - edgartools returns DataFrames
-                            # These may have dates as index or columns, we'll normalize
-                            balance_sheet_raw = financials_obj.get_balance_sheet()
-                            income_statement_raw = financials_obj.get_income_statement()
-                            cashflow_raw = financials_obj.get_cash_flow_statement()
-                            
-                            # Normalize DataFrames to match yfinance format (dates as columns, accounts as rows)
-                            def normalize_dataframe(df):
-                                """Convert SEC format to yfinance-like format (dates as columns)"""
-                                if df is None or not isinstance(df, pd.DataFrame) or len(df) == 0:
-                                    return None
-                                
-                                # edgartools typically returns: account names as index, dates as columns
-                                # This matches yfinance format, so we might not need to transpose
-                                # But check if we need to swap
-                                
-                                # Check if first column looks like dates (e.g., '2023-09-30' format)
-                                # or if index looks like account names (strings with spaces/capitalization)
-                                if len(df.columns) > 0:
-                                    first_col_sample = str(df.columns[0])[:10]
-                                    # If columns look like dates or periods, keep as is
-                                    if any(x in first_col_sample for x in ['202', '201', 'Q1', 'Q2', 'Q3', 'Q4']):
-                                        return df
-                                
-                                # If index looks like dates, transpose
-                                if len(df.index) > 0:
-                                    first_idx_sample = str(df.index[0])[:10]
-                                    if any(x in first_idx_sample for x in ['202', '201', 'Q1', 'Q2', 'Q3', 'Q4']):
-                                        df = df.T
-                                
-                                # Ensure we have columns
-                                if len(df.columns) > 0 and len(df.index) > 0:
-                                    return df
-                                return None
-                            
-                            self.balance_sheet = normalize_dataframe(balance_sheet_raw)
-                            self.financials = normalize_dataframe(income_statement_raw)
-                            self.cashflow = normalize_dataframe(cashflow_raw)
-                            
-                            # Verify we have essential data
-                            if (self.cashflow is not None and isinstance(self.cashflow, pd.DataFrame) and 
-                                len(self.cashflow.columns) > 0 and len(self.cashflow.index) > 0):
-                                if (self.financials is not None and isinstance(self.financials, pd.DataFrame) and
-                                    len(self.financials.columns) > 0 and len(self.financials.index) > 0):
-                                    return True, "Success (SEC XBRL data)"
-                            
-                            # Clear partial data if incomplete
-                            if self.cashflow is None or len(self.cashflow.columns) == 0:
-                                self.cashflow = None
-                            if self.financials is None or len(self.financials.columns) == 0:
-                                self.financials = None
-                            if self.balance_sheet is None or len(self.balance_sheet.columns) == 0:
-                                self.balance_sheet = None
-                            
-                            # If SEC data didn't work, fall back to yfinance
-                            print(f"SEC data incomplete, falling back to yfinance for {self.ticker}")
-                        else:
-                            print(f"No financials found in 10-K filing, falling back to yfinance for {self.ticker}")
-                    else:
-                        print(f"No 10-K filings found, falling back to yfinance for {self.ticker}")
-                except Exception as sec_error:
-                    import traceback
-                    print(f"Error fetching SEC data: {sec_error}")
-                    traceback.print_exc()
-                    print(f"Falling back to yfinance for {self.ticker}")
+                        # Verify we have essential data
+                        if (self.cashflow is not None and isinstance(self.cashflow, pd.DataFrame) and 
+                            len(self.cashflow.columns) > 0 and len(self.cashflow.index) > 0):
+                            if (self.financials is not None and isinstance(self.financials, pd.DataFrame) and
+                                len(self.financials.columns) > 0 and len(self.financials.index) > 0):
+                                self._trim_statements()
+                                return True, "Success (SEC XBRL data)"
+                        
+                        # Clear partial data if incomplete
+                        if self.cashflow is None or len(self.cashflow.columns) == 0:
+                            self.cashflow = None
+                        if self.financials is None or len(self.financials.columns) == 0:
+                            self.financials = None
+                        if self.balance_sheet is None or len(self.balance_sheet.columns) == 0:
+                            self.balance_sheet = None
+                        
+                        # If SEC data didn't work, fall back to yfinance
+                        print(f"SEC data incomplete, falling back to yfinance for {self.ticker}")
+                except Exception:
+                    # edgartools raises its own (httpx) errors, so anything here means fall back
+                    log.warning(f"Error fetching SEC data for {self.ticker}, falling back to yfinance",
+                                exc_info=True)
             
             # Fallback to yfinance for financial statements
             try:
-                if self.financials is None or (isinstance(self.financials, pd.DataFrame) and len(self.financials.columns) == 0):
-                    self.financials = self.stock.financials
-                if self.cashflow is None or (isinstance(self.cashflow, pd.DataFrame) and len(self.cashflow.columns) == 0):
-                    self.cashflow = self.stock.cashflow
-                if self.balance_sheet is None or (isinstance(self.balance_sheet, pd.DataFrame) and len(self.balance_sheet.columns) == 0):
-                    self.balance_sheet = self.stock.balance_sheet
-            except Exception as e:
-                pass  # Already have error handling below
+                if any(df is None or (isinstance(df, pd.DataFrame) and len(df.columns) == 0)
+                       for df in (self.financials, self.cashflow, self.balance_sheet)):
+                    yf_statements = _fetch_yf_statements(self.ticker, quarter) or {}
+                    if self.financials is None or (isinstance(self.financials, pd.DataFrame) and len(self.financials.columns) == 0):
+                        self.financials = yf_statements.get('financials')
+                    if self.cashflow is None or (isinstance(self.cashflow, pd.DataFrame) and len(self.cashflow.columns) == 0):
+                        self.cashflow = yf_statements.get('cashflow')
+                    if self.balance_sheet is None or (isinstance(self.balance_sheet, pd.DataFrame) and len(self.balance_sheet.columns) == 0):
+                        self.balance_sheet = yf_statements.get('balance_sheet')
+            except _FETCH_ERRORS:
+                log.warning(self.ticker, exc_info=True)  # Missing statements are reported below
             
             # Check if we have essential data
             if self.financials is None or self.cashflow is None:
@@ -137,139 +419,153 @@ class DCFCalculator:
             if (isinstance(self.financials, pd.DataFrame) and len(self.financials.columns) == 0) or \
                (isinstance(self.cashflow, pd.DataFrame) and len(self.cashflow.columns) == 0):
                 return False, "Financial statements are empty"
-                
+            
+            self._trim_statements()
             return True, "Success"
             
-        except Exception as e:
+        except _FETCH_ERRORS as e:
+            log.warning(self.ticker, exc_info=True)
             return False, f"Error fetching data: {str(e)}"
     
+    def _trim_statements(self):
+        """Drop periods older than any calculation needs so later lookups hit small frames"""
+        self.financials = _latest_periods(self.financials)
+        self.cashflow = _latest_periods(self.cashflow)
+        self.balance_sheet = _latest_periods(self.balance_sheet)
+        for name in ('financials', 'cashflow', 'balance_sheet'):
+            self._statement(name)
+    
+    def _statement(self, name: str) -> Optional[_StatementArrays]:
+        """Array snapshot of the named statement, rebuilt if the DataFrame was replaced"""
+        df = getattr(self, name)
+        if not isinstance(df, pd.DataFrame):
+            return None
+        snapshot = self._arrays.get(name)
+        if snapshot is None or snapshot.source is not df:
+            snapshot = self._arrays[name] = _statement_arrays(df)
+        return snapshot
+    
     def get_free_cash_flow(self, years: int = 5) -> pd.Series:
         """Calculate Free Cash Flow for the last N years"""
+        if years not in self._fcf_cache:
+            self._fcf_cache[years] = self._compute_free_cash_flow(years)
+        return self._fcf_cache[years]
+    
+    def _compute_free_cash_flow(self, years: int) -> pd.Series:
+        """Uncached body of get_free_cash_flow"""
         try:
-            if self.cashflow is None or len(self.cashflow) == 0:
+            cashflow = self._statement('cashflow')
+            if cashflow is None or len(cashflow.rows) == 0:
                 return pd.Series()
             
-            # Get Operating Cash Flow - try various names (yfinance and SEC XBRL formats)
-            operating_cf = None
-            operating_cf_keys = [
-                'Operating Cash Flow',
-                'Total Cash From Operating Activities',
-                'NetCashProvidedByUsedInOperatingActivities',  # SEC XBRL tag
-                'CashProvidedByUsedInOperatingActivities',
-                'CashFromOperatingActivities',
-                'OperatingActivitiesCashFlow'
-            ]
+            # Exact row names first (yfinance and SEC XBRL formats), in priority order
+            rows = cashflow.rows
+            operating_key = next((key for key in _OPERATING_CF_KEYS if key in rows), None)
+            capex_key = next((key for key in _CAPEX_KEYS if key in rows), None)
             
-            for key in operating_cf_keys:
-                if key in self.cashflow.index:
-                    operating_cf = self.cashflow.loc[key]
-                    break
-            
-            # If not found, search by keywords
-            if operating_cf is None:
-                for idx in self.cashflow.index:
+            # If not found, search by keywords - one pass classifying each row
+            if operating_key is None or capex_key is None:
+                for idx in rows:
                     idx_str = str(idx).lower()
-                    if (('operating' in idx_str or 'cashfromoperating' in idx_str.lower() or 
-                         'cashprovidedby' in idx_str.lower()) and 'activity' in idx_str) or \
-                       ('netcash' in idx_str and 'operating' in idx_str):
-                        operating_cf = self.cashflow.loc[idx]
+                    if operating_key is None and _OPERATING_CF_RE.search(idx_str):
+                        operating_key = idx
+                    if capex_key is None and _CAPEX_RE.search(idx_str):
+                        capex_key = idx
+                    if operating_key is not None and capex_key is not None:
                         break
-                
-            # Get Capital Expenditures - try various names
-            capex = None
-            capex_keys = [
-                'Capital Expenditure',
-                'Capital Expenditures',
-                'PaymentsForAcquisitionOfPropertyPlantAndEquipment',  # SEC XBRL tag
-                'PurchaseOfPropertyPlantAndEquipment',
-                'CapitalExpenditures',
-                'Capex'
-            ]
-            
-            for key in capex_keys:
-                if key in self.cashflow.index:
-                    capex = self.cashflow.loc[key]
-                    break
             
-            # If not found, search by keywords
-            if capex is None:
-                for idx in self.cashflow.index:
-                    idx_str = str(idx).lower()
-                    if (('capital' in idx_str and 'expenditure' in idx_str) or 
-                        ('property' in idx_str and 'plant' in idx_str and 'equipment' in idx_str) or
-                        'capex' in idx_str or
-                        ('payment' in idx_str and 'acquisition' in idx_str and 'property' in idx_str)):
-                        capex = self.cashflow.loc[idx]
-                        break
-            
-            if operating_cf is None or capex is None:
+            if operating_key is None or capex_key is None:
                 return pd.Series()
             
+            operating_cf = cashflow.values[rows[operating_key]]
+            capex = cashflow.values[rows[capex_key]]
+            
             # Calculate FCF = Operating Cash Flow - Capital Expenditures
             # Handle negative capex (it's usually reported as negative in financial statements)
             # In XBRL, capex might be reported as positive (outflow), so take absolute value
-            if isinstance(capex, pd.Series):
-                # If capex values are all positive, they're outflows - make negative
-                if capex.min() >= 0:
-                    capex = -abs(capex)
-                fcf = operating_cf - capex
-            else:
-                # Single value
-                if capex >= 0:
-                    capex = -abs(capex)
-                fcf = operating_cf - capex
-            
-            # Convert to Series if needed
-            if not isinstance(fcf, pd.Series):
-                fcf = pd.Series([fcf])
+            reported = capex[~np.isnan(capex)]
+            if reported.size and reported.min() >= 0:
+                capex = -np.abs(capex)
+            fcf_values = operating_cf - capex
             
             # Sort by date (columns) and get most recent years
             # For edgartools, dates are typically in columns
-            if isinstance(fcf, pd.Series):
-                fcf = fcf.sort_index(ascending=False)
-                fcf = fcf.head(years)
-            
-            return fcf
-            
-        except Exception as e:
-            import traceback
-            print(f"Error in get_free_cash_flow: {e}")
-            traceback.print_exc()
+            columns = cashflow.columns
+            if len(columns) > years and pd.api.types.is_datetime64_any_dtype(columns):
+                # Select the most recent N dates with a partial sort instead of sorting everything
+                dates = columns.values
+                k = len(dates) - years
+                latest = np.argpartition(dates, k)[k:]
+                latest = latest[np.argsort(dates[latest])[::-1]]
+                return pd.Series(fcf_values[latest], index=columns[latest])
+            
+            fcf = pd.Series(fcf_values, index=columns)
+            return fcf.sort_index(ascending=False).head(years)
+            
+        except Exception:
+            log.exception(f"Error in get_free_cash_flow for {self.ticker}")
             return pd.Series()
     
-    def calculate_growth_rate(self, method: str = "average") -> float:
-        """Calculate growth rate based on historical FCF"""
-        fcf = self.get_free_cash_flow(years=5)
+    def _latest_values(self, statement: str, names) -> list:
+        """Most recent (first column) value of each named row, or None where the row is missing"""
+        arrays = self._statement(statement)
+        if arrays is None or arrays.values.shape[1] == 0:
+            return [None] * len(names)
+        latest = arrays.values[:, 0]
+        return [latest[arrays.rows[name]] if name in arrays.rows else None for name in names]
+    
+    def _latest_debt_and_cash(self) -> Tuple[float, float]:
+        """Total debt and cash & equivalents from the most recent balance sheet (0 where missing)"""
+        total_debt, long_term_debt, current_debt, cash = self._latest_values(
+            'balance_sheet', _BALANCE_SHEET_ROWS)
+        if total_debt is None:
+            if long_term_debt is not None and current_debt is not None:
+                total_debt = long_term_debt + current_debt
+            else:
+                total_debt = 0
+        return total_debt, cash if cash is not None else 0
+    
+    def calculate_growth_rate(self, method: str = "average", fcf: Optional[pd.Series] = None) -> float:
+        """Calculate growth rate based on historical FCF (the last 5 years unless fcf is given)"""
+        own_fcf = fcf is None or fcf is self._fcf_cache.get(5)
+        if own_fcf and method in self._growth_cache:
+            return self._growth_cache[method]
+        
+        if fcf is None:
+            fcf = self.get_free_cash_flow(years=5)
+        growth = self._growth_rate_from(fcf, method)
         
+        if own_fcf:
+            self._growth_cache[method] = growth
+        return growth
+    
+    @staticmethod
+    def _growth_rate_from(fcf: pd.Series, method: str) -> float:
+        """Uncached body of calculate_growth_rate"""
         if len(fcf) < 2:
             return 0.0
         
+        fcf_values = fcf.to_numpy(dtype=np.float64)
+        
         if method == "average":
-            # Average year-over-year growth rate
-            growth_rates = []
-            fcf_values = fcf.values
-            
-            for i in range(len(fcf_values) - 1):
-                if fcf_values[i+1] != 0 and not pd.isna(fcf_values[i+1]):
-                    growth = (fcf_values[i] - fcf_values[i+1]) / abs(fcf_values[i+1])
-                    growth_rates.append(growth)
-            
-            if growth_rates:
-                return np.mean(growth_rates)
+            # Average year-over-year growth rate (skipping zero/NaN base years)
+            change = fcf_values[:-1] - fcf_values[1:]
+            base = np.abs(fcf_values[1:])
+            valid = (base != 0) & ~np.isnan(base) & ~np.isnan(change)
+            if valid.any():
+                return float(np.mean(change[valid] / base[valid]))
             return 0.0
             
         elif method == "cagr":
             # Compound Annual Growth Rate
-            fcf_values = fcf.values
-            if len(fcf_values) >= 2 and fcf_values[-1] != 0:
+            if fcf_values[-1] != 0:
                 cagr = ((fcf_values[0] / abs(fcf_values[-1])) ** (1 / (len(fcf_values) - 1))) - 1
                 return cagr
             return 0.0
             
         elif method == "recent":
             # Growth rate from last 2 years
-            fcf_values = fcf.values
-            if len(fcf_values) >= 2 and fcf_values[1] != 0:
+            if fcf_values[1] != 0:
                 growth = (fcf_values[0] - fcf_values[1]) / abs(fcf_values[1])
                 return growth
             return 0.0
@@ -278,6 +574,13 @@ class DCFCalculator:
     
     def calculate_wacc(self, risk_free_rate: float = 0.04, market_risk_premium: float = 0.06) -> float:
         """Calculate Weighted Average Cost of Capital"""
+        key = (risk_free_rate, market_risk_premium)
+        if key not in self._wacc_cache:
+            self._wacc_cache[key] = self._compute_wacc(risk_free_rate, market_risk_premium)
+        return self._wacc_cache[key]
+    
+    def _compute_wacc(self, risk_free_rate: float, market_risk_premium: float) -> float:
+        """Uncached body of calculate_wacc"""
         try:
             # Get beta
             beta = self.info.get('beta', 1.0) if self.info else 1.0
@@ -289,15 +592,12 @@ class DCFCalculator:
             total_debt = 0
             
             if self.financials is not None:
-                if 'Interest Expense' in self.financials.index:
-                    interest_expense = abs(self.financials.loc['Interest Expense'].iloc[0])
+                latest_interest, = self._latest_values('financials', ['Interest Expense'])
+                if latest_interest is not None:
+                    interest_expense = abs(latest_interest)
             
             if self.balance_sheet is not None:
-                if 'Total Debt' in self.balance_sheet.index:
-                    total_debt = self.balance_sheet.loc['Total Debt'].iloc[0]
-                elif 'Long Term Debt' in self.balance_sheet.index and 'Current Debt' in self.balance_sheet.index:
-                    total_debt = (self.balance_sheet.loc['Long Term Debt'].iloc[0] + 
-                                 self.balance_sheet.loc['Current Debt'].iloc[0])
+                total_debt, _ = self._latest_debt_and_cash()
             
             cost_of_debt = (interest_expense / total_debt) if total_debt > 0 else 0.05
             
@@ -329,10 +629,47 @@ class DCFCalculator:
             
             return max(wacc, 0.01)  # Ensure positive WACC
             
-        except Exception as e:
+        except Exception:
             # Fallback to default WACC
+            log.warning(f"Could not compute WACC for {self.ticker}, using 10%", exc_info=True)
             return 0.10
     
+    def _net_debt(self) -> float:
+        """Total debt minus cash from the latest balance sheet (0 without one)"""
+        if self.balance_sheet is None:
+            return 0
+        total_debt, cash_and_equivalents = self._latest_debt_and_cash()
+        return total_debt - cash_and_equivalents
+    
+    def _shares_outstanding(self) -> float:
+        """Shares outstanding from market data (1 if unknown, so per-share = equity value)"""
+        shares_outstanding = self.info.get('sharesOutstanding', 0) if self.info else 0
+        if shares_outstanding is None or shares_outstanding == 0:
+            shares_outstanding = 1  # Fallback
+        return shares_outstanding
+    
+    def sensitivity_grid(self, growth_grid, discount_grid,
+                         projection_years: int = 10,
+                         terminal_growth_rate: float = 0.025) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Per-share value over a grid of growth and discount rates
+        
+        Returns (values, growth_grid, discount_grid) where values[i, j] uses
+        growth_grid[i] and discount_grid[j], or None if FCF is unavailable.
+        Growth rates are capped the same way as in calculate_dcf.
+        """
+        fcf_history = self.get_free_cash_flow(years=5)
+        if len(fcf_history) == 0:
+            return None
+        
+        growth_grid = np.asarray(growth_grid, dtype=np.float64)
+        discount_grid = np.asarray(discount_grid, dtype=np.float64)
+        enterprise_values = dcf_grid(np.clip(growth_grid, -0.20, 0.50), discount_grid,
+                                     float(fcf_history.iat[0]), int(projection_years),
+                                     float(terminal_growth_rate))
+        values = (enterprise_values - self._net_debt()) / self._shares_outstanding()
+        return values, growth_grid, discount_grid
+    
     def calculate_dcf(self, 
                      growth_rate: Optional[float] = None,
                      growth_method: str = "average",
@@ -340,12 +677,17 @@ class DCFCalculator:
                      risk_free_rate: float = 0.04,
                      market_risk_premium: float = 0.06,
                      projection_years: int = 10,
-                     terminal_growth_rate: float = 0.025) -> Dict:
+                     terminal_growth_rate: float = 0.025,
+                     detailed: bool = True) -> Dict:
         """
         Calculate DCF valuation
         
+        growth_rate and discount_rate may also be 1-D arrays to price a sweep of
+        scenarios in one call; valuation outputs then come back as arrays.
+        
         Returns dictionary with:
-        - projected_fcf: projected free cash flows
+        - projected_fcf: projected free cash flows (only when detailed=True)
+        - fcf_arr / discounted_arr / discount_factors: projected FCF, discounted FCF and 1/(1+r)^year arrays
         - terminal_value: terminal value
         - enterprise_value: total enterprise value
         - equity_value: equity value (enterprise value - net debt)
@@ -356,61 +698,62 @@ class DCFCalculator:
         if len(fcf_history) == 0:
             return {"error": "Could not calculate FCF from financial data"}
         
-        current_fcf = fcf_history.iloc[0]  # Most recent FCF
+        current_fcf = fcf_history.iat[0]  # Most recent FCF
         
         # Calculate or use provided growth rate
         if growth_rate is None:
-            growth_rate = self.calculate_growth_rate(method=growth_method)
-        
-        # Cap growth rate at reasonable levels
-        growth_rate = max(min(growth_rate, 0.50), -0.20)  # Between -20% and 50%
+            growth_rate = self.calculate_growth_rate(method=growth_method, fcf=fcf_history)
         
         # Calculate or use provided discount rate (WACC)
         if discount_rate is None:
             discount_rate = self.calculate_wacc(risk_free_rate, market_risk_premium)
         
-        # Project FCF for next N years
-        projected_fcf = []
-        for year in range(1, projection_years + 1):
-            projected_fcf_year = current_fcf * ((1 + growth_rate) ** year)
-            projected_fcf.append({
-                'year': year,
-                'fcf': projected_fcf_year,
-                'discounted_fcf': projected_fcf_year / ((1 + discount_rate) ** year)
-            })
+        # Rates may be scalars or 1-D sweeps (lists or arrays); convert them once for both paths
+        growth_rate = np.clip(np.asarray(growth_rate, dtype=np.float64), -0.20, 0.50)  # Between -20% and 50%
+        discount_rate = np.asarray(discount_rate, dtype=np.float64)
         
-        # Calculate terminal value using perpetuity growth model
-        final_year_fcf = projected_fcf[-1]['fcf']
-        terminal_value = (final_year_fcf * (1 + terminal_growth_rate)) / (discount_rate - terminal_growth_rate)
-        discounted_terminal_value = terminal_value / ((1 + discount_rate) ** projection_years)
+        if growth_rate.ndim == 0 and discount_rate.ndim == 0:
+            growth_rate, discount_rate = float(growth_rate), float(discount_rate)
+            # Single scenario - one pass of the compiled kernel projects, discounts and values
+            fcf_arr = np.empty(projection_years)
+            disc_arr = np.empty(projection_years)
+            discount_factors = np.empty(projection_years)
+            enterprise_value, terminal_value, discounted_terminal_value = dcf_projection(
+                float(current_fcf), growth_rate, discount_rate,
+                int(projection_years), float(terminal_growth_rate), fcf_arr, disc_arr, discount_factors)
+        else:
+            # Project FCF for next N years - rates broadcast against the trailing year axis
+            # Running products give (1+g)^year and 1/(1+r)^year without a pow per year
+            def powers(base):
+                base = np.asarray(base, dtype=np.float64)[..., np.newaxis]
+                return np.cumprod(np.broadcast_to(base, base.shape[:-1] + (projection_years,)), axis=-1)
+            
+            growth_factors = powers(1.0 + growth_rate)
+            discount_factors = powers(1.0 / (1.0 + discount_rate))
+            fcf_arr = current_fcf * growth_factors
+            disc_arr = fcf_arr * discount_factors
+            
+            # Calculate terminal value using perpetuity growth model
+            final_year_fcf = np.take(fcf_arr, -1, axis=-1)
+            terminal_value = (final_year_fcf * (1 + terminal_growth_rate)) / (discount_rate - terminal_growth_rate)
+            discounted_terminal_value = terminal_value * np.take(discount_factors, -1, axis=-1)
+            
+            # Enterprise value = sum of discounted FCFs + discounted terminal value
+            enterprise_value = disc_arr.sum(axis=-1) + discounted_terminal_value
         
-        # Enterprise value = sum of discounted FCFs + discounted terminal value
-        sum_discounted_fcf = sum([year['discounted_fcf'] for year in projected_fcf])
-        enterprise_value = sum_discounted_fcf + discounted_terminal_value
+        projected_fcf = None
+        if detailed and fcf_arr.ndim == 1:
+            projected_fcf = [
+                {'year': year, 'fcf': fcf, 'discounted_fcf': discounted_fcf}
+                for year, (fcf, discounted_fcf) in enumerate(zip(fcf_arr.tolist(), disc_arr.tolist()), start=1)
+            ]
         
         # Calculate equity value = enterprise value - net debt
-        net_debt = 0
-        if self.balance_sheet is not None:
-            total_debt = 0
-            if 'Total Debt' in self.balance_sheet.index:
-                total_debt = self.balance_sheet.loc['Total Debt'].iloc[0]
-            elif 'Long Term Debt' in self.balance_sheet.index and 'Current Debt' in self.balance_sheet.index:
-                total_debt = (self.balance_sheet.loc['Long Term Debt'].iloc[0] + 
-                             self.balance_sheet.loc['Current Debt'].iloc[0])
-            
-            cash_and_equivalents = 0
-            if 'Cash And Cash Equivalents' in self.balance_sheet.index:
-                cash_and_equivalents = self.balance_sheet.loc['Cash And Cash Equivalents'].iloc[0]
-            
-            net_debt = total_debt - cash_and_equivalents
-        
+        net_debt = self._net_debt()
         equity_value = enterprise_value - net_debt
         
         # Value per share
-        shares_outstanding = self.info.get('sharesOutstanding', 0) if self.info else 0
-        if shares_outstanding is None or shares_outstanding == 0:
-            shares_outstanding = 1  # Fallback
-        
+        shares_outstanding = self._shares_outstanding()
         per_share_value = equity_value / shares_outstanding
         
         # Current stock price for comparison
@@ -418,8 +761,10 @@ class DCFCalculator:
         if current_price is None:
             current_price = 0
         
-        return {
-            'projected_fcf': projected_fcf,
+        result = {
+            'fcf_arr': fcf_arr,
+            'discounted_arr': disc_arr,
+            'discount_factors': discount_factors,
             'terminal_value': terminal_value,
             'discounted_terminal_value': discounted_terminal_value,
             'enterprise_value': enterprise_value,
@@ -435,4 +780,7 @@ class DCFCalculator:
             'risk_free_rate': risk_free_rate,
             'market_risk_premium': market_risk_premium
         }
+        if projected_fcf is not None:
+            result['projected_fcf'] = projected_fcf
+        return result
 
@@ -3,27 +3,378 @@ DCF Calculator Desktop App
 Clean PyQt interface for Discounted Cash Flow valuation
 """
 
+import contextlib
+import functools
+import math
+import re
 import sys
+import threading
+import traceback
+from datetime import date
+from typing import Dict, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                 QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                                 QComboBox, QDoubleSpinBox, QTextEdit, QGroupBox,
-                                QMessageBox, QProgressBar, QTableWidget, 
-                                QTableWidgetItem, QHeaderView, QScrollArea,
-                                QGridLayout, QTabWidget, QSizePolicy, QDialog)
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont, QColor, QPen, QBrush
+                                QMessageBox, QProgressBar, QTableView, 
+                                QHeaderView, QScrollArea,
+                                QGridLayout, QTabWidget, QSizePolicy, QDialog,
+                                QSplitter)
+from PySide6.QtCore import (Qt, QObject, QRunnable, QThreadPool, QTimer, Signal,
+                            QAbstractTableModel, QModelIndex)
+from PySide6.QtGui import QFont, QColor, QPen, QBrush, QPalette, QPixmapCache
 from dcf_calculator import DCFCalculator
-import locale
+import dcf_core
 
 
-class DCFWorker(QThread):
-    """Worker thread to calculate DCF without freezing UI"""
+_MONEY_FMT = "${:,.2f}".format
+
+
+def format_money(value: float) -> str:
+    """US-dollar string with thousands separators, e.g. -$1,234.50"""
+    return "-" + _MONEY_FMT(-value) if value < 0 else _MONEY_FMT(value)
+
+
+def format_money_cell(value) -> str:
+    """format_money for a table cell (None, NaN, inf and non-numbers show as N/A)"""
+    try:
+        value = float(value)
+    except (ValueError, TypeError, OverflowError):
+        return "N/A"
+    return _money_cell_text(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _money_cell_text(value: float) -> str:
+    # The same few values (current FCF, market cap, debt, ...) recur across the breakdown tabs
+    return format_money(value) if math.isfinite(value) else "N/A"
+
+
+def format_money_array(values) -> np.ndarray:
+    """format_money over an array of any shape (NaN and inf cells become "N/A")"""
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values)
+    out = np.full(values.shape, "N/A", dtype=object)
+    out[finite] = [format_money(value) for value in values[finite].tolist()]
+    return out
+
+
+def _keyword_pattern(*keywords):
+    """Case-insensitive regex matching any of the keywords as a substring"""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Line items shown in the raw statement tables when a statement has them
+_CASHFLOW_ITEMS = ('Operating Cash Flow', 'Total Cash From Operating Activities',
+                   'Capital Expenditure', 'Capital Expenditures', 'Free Cash Flow',
+                   'Total Cashflows From Operating Activities', 'Cash And Cash Equivalents At End Of Period')
+_BALANCE_SHEET_ITEMS = ('Total Debt', 'Long Term Debt', 'Current Debt',
+                        'Cash And Cash Equivalents', 'Total Assets', 'Total Liabilities',
+                        'Cash Cash Equivalents And Short Term Investments', 'Short Term Debt')
+_INCOME_ITEMS = ('Total Revenue', 'Revenue', 'Net Income', 'Interest Expense',
+                 'Operating Income', 'Operating Income Loss', 'Gross Profit',
+                 'Cost Of Revenue', 'Income Tax Expense')
+
+# Fallback searches for the raw statement tables: one pattern per kind of line item
+_CASHFLOW_KEYWORDS = (
+    _keyword_pattern('operating', 'cash from operating', 'operating activities'),
+    _keyword_pattern('capital expenditure', 'capex', 'capital expenditures'),
+    _keyword_pattern('free cash flow'),
+    _keyword_pattern('total cash'),
+)
+_BALANCE_SHEET_KEYWORDS = (
+    _keyword_pattern('total debt', 'long term debt', 'current debt', 'short term debt'),
+    _keyword_pattern('cash', 'cash equivalents'),
+    _keyword_pattern('total assets'),
+    _keyword_pattern('total liabilities', 'total liability'),
+)
+_INCOME_KEYWORDS = (
+    _keyword_pattern('total revenue', 'revenue', 'net revenue'),
+    _keyword_pattern('net income', 'operating income', 'income'),
+    _keyword_pattern('interest expense', 'interest'),
+    _keyword_pattern('gross profit', 'profit'),
+)
+
+
+def add_keyword_matches(index, patterns, found):
+    """Append to found the first label in index matching each pattern that isn't already in found"""
+    labels = index.astype(str).str
+    for pattern in patterns:
+        for position in np.flatnonzero(labels.contains(pattern)):
+            item = index[position]
+            if item not in found:
+                found.append(item)
+                break
+    return found
+
+
+def aligned_statement_row(df, keys, periods) -> np.ndarray:
+    """
+    Values of the first of keys found in df, one per period
+    
+    Each period takes the value in the same column position, or the value under the
+    same period label when that one is missing. NaN where neither exists.
+    """
+    values = np.full(len(periods), np.nan)
+    if df is None:
+        return values
+    key = next((key for key in keys if key in df.index), None)
+    if key is None:
+        return values
+    # First row under that label, taken by position so no de-duplicated copy of df is made
+    row = pd.to_numeric(df.iloc[df.index.get_indexer_for([key])[0]], errors='coerce')
+    count = min(len(periods), len(row))
+    values[:count] = row.to_numpy(dtype=np.float64)[:count]
+    by_label = row[~row.index.duplicated()].reindex(periods).to_numpy(dtype=np.float64)
+    return np.where(np.isnan(values), by_label, values)
+
+
+def latest_statement_value(df, key, default=0.0) -> float:
+    """Most recent (first column) value of a statement row, or default when missing or NaN"""
+    value = aligned_statement_row(df, (key,), df.columns[:1])[0]
+    return default if np.isnan(value) else float(value)
+
+
+@functools.lru_cache(maxsize=128)
+def period_label(col) -> str:
+    """Column header for a statement period (the year when the label is a date)"""
+    # Cached: the three statements usually share the same period columns
+    if hasattr(col, 'year'):
+        return str(col.year)
+    if hasattr(col, 'strftime'):
+        try:
+            return col.strftime('%Y')
+        except Exception:
+            return str(col)[:10]
+    col_str = str(col)
+    return col_str[:12] if len(col_str) > 12 else col_str
+
+
+def period_labels(index) -> list:
+    """period_label for every entry of a period index (vectorised for plain date indexes)"""
+    if isinstance(index, pd.DatetimeIndex) and not index.hasnans:
+        return index.year.astype(str).tolist()
+    return [period_label(period) for period in index]
+
+
+@functools.lru_cache(maxsize=None)
+def app_font(point_size: int, bold: bool = False) -> QFont:
+    """Shared default-family font (built on first use, once a QApplication exists)"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+class CellStyle(NamedTuple):
+    """Optional formatting for a single table cell"""
+    bold: bool = False
+    background: Optional[QColor] = None
+    foreground: Optional[QColor] = None
+    alignment: Optional[Qt.AlignmentFlag] = None
+    tooltip: Optional[str] = None
+
+
+# Value formats for schema-driven table rows
+_CELL_FORMATS = {
+    'currency': format_money_cell,
+    'percent': "{:.2%}".format,
+    'count': "{:,.0f}".format,
+}
+
+# (label, result key, format) for the fixed rows of the results tables
+_SUMMARY_SCHEMA = (
+    ("Current FCF", 'current_fcf', 'currency'),
+    ("Growth Rate", 'growth_rate', 'percent'),
+    ("Discount Rate (WACC)", 'discount_rate', 'percent'),
+    ("Terminal Growth Rate", 'terminal_growth_rate', 'percent'),
+    ("Shares Outstanding", 'shares_outstanding', 'count'),
+)
+_VALUATION_SCHEMA = (
+    ("Terminal Value", 'terminal_value', 'currency'),
+    ("Discounted Terminal Value", 'discounted_terminal_value', 'currency'),
+    ("Enterprise Value", 'enterprise_value', 'currency'),
+    ("Net Debt", 'net_debt', 'currency'),
+    ("Equity Value", 'equity_value', 'currency'),
+    ("Value Per Share", 'per_share_value', 'currency'),
+)
+
+
+def schema_rows(schema, result):
+    """(label, formatted value) rows for a (label, result key, format) schema"""
+    return [(label, _CELL_FORMATS[kind](result[key])) for label, key, kind in schema]
+
+
+# Shared cell colors (built once, not per row)
+BLACK = QColor(0, 0, 0)
+TOTAL_GRAY = QColor(170, 170, 170)  # Darker gray - more visible than white
+UNDERVALUED_GREEN = QColor(120, 180, 120)
+OVERVALUED_RED = QColor(180, 120, 120)
+RESULT_BLUE = QColor(230, 230, 255)
+RESULT_GREEN = QColor(230, 255, 230)
+STEP_BLUE = QColor(240, 240, 255)
+
+# Common cell styles
+ALIGN_RIGHT = Qt.AlignRight | Qt.AlignVCenter
+RIGHT_ALIGNED = CellStyle(alignment=ALIGN_RIGHT)
+BOLD = CellStyle(bold=True)
+
+
+class DCFTableModel(QAbstractTableModel):
+    """Read-only table model backed by a plain list of row tuples"""
+    
+    def __init__(self, headers=(), parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+        self._columns = len(self._headers)
+        self._styles = {}  # (row, column) -> CellStyle
+    
+    def set_rows(self, rows, headers=None, styles=None):
+        """Replace the table contents (in place when the shape is unchanged, else in one reset)"""
+        # Cells are stringified once here, not on every paint
+        rows = [tuple(map(str, row)) for row in rows]
+        headers = self._headers if headers is None else list(headers)
+        columns = len(headers) if headers else max((len(row) for row in rows), default=0)
+        
+        if (self._rows and len(rows) == len(self._rows) and headers == self._headers
+                and columns == self._columns):
+            # Same shape: keep row/column geometry and just repaint the values
+            self._rows = rows
+            self._styles = dict(styles) if styles else {}
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, columns - 1))
+            return
+        
+        self.beginResetModel()
+        self._headers = headers
+        self._rows = rows
+        self._columns = columns
+        self._styles = dict(styles) if styles else {}
+        self.endResetModel()
+    
+    def clear(self):
+        """Remove all rows (headers are kept)"""
+        self.set_rows([])
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._columns
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            values = self._rows[row]
+            return values[column] if column < len(values) else ""
+        
+        style = self._styles.get((row, column))
+        if style is None:
+            return None
+        if role == Qt.TextAlignmentRole:
+            return style.alignment
+        if role == Qt.BackgroundRole:
+            return style.background
+        if role == Qt.ForegroundRole:
+            return style.foreground
+        if role == Qt.ToolTipRole:
+            return style.tooltip
+        if role == Qt.FontRole and style.bold:
+            return app_font(9, bold=True)
+        return None
+
+
+@contextlib.contextmanager
+def updates_suspended(widget):
+    """Turn off painting for widget (and its children) so a bulk fill repaints once at the end"""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
+# Minimum height of every table row, in pixels
+TABLE_ROW_HEIGHT = 24
+
+
+def make_table_view(headers=()):
+    """Read-only QTableView with a DCFTableModel and fixed-height rows"""
+    view = QTableView()
+    view.setModel(DCFTableModel(headers, view))
+    view.setEditTriggers(QTableView.NoEditTriggers)
+    view.verticalHeader().setVisible(False)  # Row numbers are never shown
+    # Uniform rows: the view never has to measure cell contents to lay out
+    view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    # All cells are single-line text: one line of the view font plus padding fits every row
+    view.verticalHeader().setDefaultSectionSize(max(TABLE_ROW_HEIGHT, view.fontMetrics().height() + 6))
+    view.setHorizontalScrollMode(QTableView.ScrollPerPixel)
+    view.setVerticalScrollMode(QTableView.ScrollPerPixel)
+    return view
+
+
+# Shorthands for per-column header modes
+FIT = QHeaderView.ResizeToContents
+STRETCH = QHeaderView.Stretch
+
+
+def configure_header(view, modes, stretch_last=False):
+    """Apply one QHeaderView resize mode per column in a single pass"""
+    header = view.horizontalHeader()
+    header.setStretchLastSection(stretch_last)
+    for column, mode in enumerate(modes):
+        header.setSectionResizeMode(column, mode)
+
+
+# Calculators with fetched statements, keyed by (ticker, day) so recalculating
+# with different assumptions doesn't refetch anything
+_CALC_CACHE: Dict[Tuple[str, str], DCFCalculator] = {}
+_CALC_CACHE_LOCK = threading.Lock()
+
+
+class CalculationInputs(NamedTuple):
+    """User inputs for one DCF calculation, in DCFWorker argument order"""
+    ticker: str
+    growth_method: str
+    growth_rate: Optional[float]
+    discount_rate: float
+    risk_free_rate: float
+    market_risk_premium: float
+    terminal_growth_rate: float
+
+
+class WarmupTask(QRunnable):
+    """Background task that compiles the DCF kernels while the user types a ticker"""
+    
+    def run(self):
+        try:
+            dcf_core.warmup()
+        except Exception as e:
+            # First calculation just pays the compile cost instead
+            print(f"Warning: DCF kernel warm-up failed: {e}")
+
+
+class DCFWorkerSignals(QObject):
+    """Signals emitted by DCFWorker (QRunnable can't define signals itself)"""
     finished = Signal(dict)  # result dict with calculator stored inside
     error = Signal(str)
+
+
+class DCFWorker(QRunnable):
+    """Pooled task to calculate DCF without freezing UI"""
     
     def __init__(self, ticker, growth_method, growth_rate, discount_rate, risk_free_rate, 
                  market_risk_premium, terminal_growth_rate):
         super().__init__()
+        self.signals = DCFWorkerSignals()
         self.ticker = ticker
         self.growth_method = growth_method
         self.growth_rate = growth_rate
@@ -34,12 +385,23 @@ class DCFWorker(QThread):
     
     def run(self):
         try:
-            calc = DCFCalculator(self.ticker)
-            success, message = calc.fetch_data()
+            key = (self.ticker.upper(), date.today().isoformat())
+            with _CALC_CACHE_LOCK:
+                calc = _CALC_CACHE.get(key)
             
-            if not success:
-                self.error.emit(message)
-                return
+            if calc is None:
+                calc = DCFCalculator(self.ticker)
+                success, message = calc.fetch_data()
+                
+                if not success:
+                    self.signals.error.emit(message)
+                    return
+                
+                with _CALC_CACHE_LOCK:
+                    # Entries from previous days are stale
+                    for old_key in [k for k in _CALC_CACHE if k[1] != key[1]]:
+                        del _CALC_CACHE[old_key]
+                    _CALC_CACHE[key] = calc
             
             # Use manual growth rate if provided, otherwise use method
             growth_rate_input = self.growth_rate if self.growth_method == "manual" else None
@@ -56,16 +418,15 @@ class DCFWorker(QThread):
             )
             
             if "error" in result:
-                self.error.emit(result["error"])
+                self.signals.error.emit(result["error"])
             else:
                 # Store calculator in result dict
                 result['_calculator'] = calc
-                self.finished.emit(result)
+                self.signals.finished.emit(result)
                 
         except Exception as e:
-            import traceback
             error_msg = f"Error: {str(e)}\n{traceback.format_exc()}"
-            self.error.emit(error_msg)
+            self.signals.error.emit(error_msg)
 
 
 class DetailedBreakdownDialog(QDialog):
@@ -87,9 +448,103 @@ class DetailedBreakdownDialog(QDialog):
         self.detail_tabs = QTabWidget()
         self.detail_tabs.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
-        # Tab 1: Raw Financial Data
-        self.raw_data_tab = QWidget()
-        raw_data_layout = QVBoxLayout()
+        # Tabs are only built (and filled) the first time they are shown
+        self._tab_builders = [
+            self._build_raw_data_tab,
+            self._build_fcf_tab,
+            self._build_growth_tab,
+            self._build_wacc_tab,
+            self._build_dcf_steps_tab,
+            self._build_assumptions_tab,
+        ]
+        for title in ("Raw Financial Data", "FCF Calculation", "Growth Rate",
+                      "WACC Calculation", "DCF Steps", "All Assumptions"):
+            self.detail_tabs.addTab(QWidget(), title)
+        self._built = [False] * len(self._tab_builders)
+        self._fillers = []
+        self._filled = []
+        self.detail_tabs.currentChanged.connect(self._ensure_tab)
+        
+        main_layout.addWidget(self.detail_tabs)
+        
+        # Close button at bottom
+        button_layout = QHBoxLayout()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        close_btn.setMinimumHeight(35)
+        button_layout.addStretch()
+        button_layout.addWidget(close_btn)
+        button_layout.addStretch()
+        main_layout.addLayout(button_layout)
+        
+        self._ensure_tab(self.detail_tabs.currentIndex())
+    
+    def set_fillers(self, fillers):
+        """Install one (name, callable) populate step per tab; the visible tab is filled right away"""
+        self._fillers = list(fillers)
+        self._filled = [False] * len(self._fillers)
+        self._ensure_tab(self.detail_tabs.currentIndex())
+        # The remaining tabs are filled in the background once the dialog is up
+        # (fillers only read data the worker already fetched)
+        QTimer.singleShot(0, self._prefill_next_tab)
+    
+    def _prefill_next_tab(self):
+        """Build one not-yet-visited tab per event-loop turn so later tab switches are instant"""
+        if not self.isVisible():
+            return
+        pending = [index for index in range(self.detail_tabs.count())
+                   if not self._built[index] or (index < len(self._fillers) and not self._filled[index])]
+        if pending:
+            self._ensure_tab(pending[0])
+        if len(pending) > 1:
+            QTimer.singleShot(0, self._prefill_next_tab)
+    
+    def _ensure_tab(self, index):
+        """Build and fill a tab the first time it is shown"""
+        if index < 0:
+            return
+        page = self.detail_tabs.widget(index)
+        with updates_suspended(page):
+            if not self._built[index]:
+                self._tab_builders[index](page)
+                self._built[index] = True
+            if index < len(self._fillers) and not self._filled[index]:
+                # Wrap each population in try-except so one failure doesn't break others
+                self._filled[index] = True
+                name, fill = self._fillers[index]
+                try:
+                    fill()
+                except Exception as e:
+                    print(f"Error populating {name}: {e}")
+                    traceback.print_exc()
+    
+    def _make_table_tab(self, page, explanation, headers, modes, stretch_last=False, min_height=200):
+        """Lay out an explanation label above a table on a tab page; returns the table"""
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(5, 5, 5, 5)
+        # Explanation and table share a resizable splitter; the table scrolls itself
+        splitter = QSplitter(Qt.Vertical)
+        splitter.setChildrenCollapsible(False)
+        
+        label = QLabel(explanation)
+        label.setWordWrap(True)
+        label.setFont(app_font(10))
+        splitter.addWidget(label)
+        
+        table = make_table_view(headers)
+        table.setAlternatingRowColors(True)
+        table.setMinimumHeight(min_height)
+        configure_header(table, modes, stretch_last=stretch_last)
+        splitter.addWidget(table)
+        
+        splitter.setStretchFactor(1, 1)  # Extra height goes to the table
+        layout.addWidget(splitter)
+        return table
+    
+    def _build_raw_data_tab(self, page):
+        """Raw Financial Data tab"""
+        self.raw_data_tab = page
+        raw_data_layout = QVBoxLayout(page)
         raw_data_layout.setContentsMargins(5, 5, 5, 5)
         raw_data_scroll = QScrollArea()
         raw_data_scroll.setWidgetResizable(True)
@@ -97,154 +552,64 @@ class DetailedBreakdownDialog(QDialog):
         raw_data_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         raw_data_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         raw_data_container = QWidget()
-        raw_data_container_layout = QVBoxLayout()
+        raw_data_container_layout = QVBoxLayout(raw_data_container)
         raw_data_container_layout.setSpacing(15)
         raw_data_container_layout.setContentsMargins(10, 10, 10, 10)
         
         # Financial statements tables
-        summary_font = QFont()
-        summary_font.setPointSize(11)
-        summary_font.setBold(True)
-        
-        # Cash Flow Statement
-        cashflow_label = QLabel("Cash Flow Statement (Key Items)")
-        cashflow_label.setFont(summary_font)
-        raw_data_container_layout.addWidget(cashflow_label)
-        self.cashflow_table = QTableWidget()
-        self.cashflow_table.setAlternatingRowColors(True)
-        self.cashflow_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.cashflow_table.setMinimumHeight(150)
-        self.cashflow_table.horizontalHeader().setStretchLastSection(False)
-        self.cashflow_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        raw_data_container_layout.addWidget(self.cashflow_table)
-        
-        # Balance Sheet
-        balance_label = QLabel("Balance Sheet (Key Items)")
-        balance_label.setFont(summary_font)
-        raw_data_container_layout.addWidget(balance_label)
-        self.balance_sheet_table = QTableWidget()
-        self.balance_sheet_table.setAlternatingRowColors(True)
-        self.balance_sheet_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.balance_sheet_table.setMinimumHeight(150)
-        self.balance_sheet_table.horizontalHeader().setStretchLastSection(False)
-        self.balance_sheet_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        raw_data_container_layout.addWidget(self.balance_sheet_table)
-        
-        # Income Statement
-        income_label = QLabel("Income Statement (Key Items)")
-        income_label.setFont(summary_font)
-        raw_data_container_layout.addWidget(income_label)
-        self.income_table = QTableWidget()
-        self.income_table.setAlternatingRowColors(True)
-        self.income_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.income_table.setMinimumHeight(150)
-        self.income_table.horizontalHeader().setStretchLastSection(False)
-        self.income_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        raw_data_container_layout.addWidget(self.income_table)
-        
-        raw_data_container.setLayout(raw_data_container_layout)
+        summary_font = app_font(11, bold=True)
+        for attr, title in (("cashflow_table", "Cash Flow Statement (Key Items)"),
+                            ("balance_sheet_table", "Balance Sheet (Key Items)"),
+                            ("income_table", "Income Statement (Key Items)")):
+            label = QLabel(title)
+            label.setFont(summary_font)
+            raw_data_container_layout.addWidget(label)
+            table = make_table_view()
+            table.setAlternatingRowColors(True)
+            table.setMinimumHeight(150)
+            table.horizontalHeader().setStretchLastSection(False)
+            table.horizontalHeader().setSectionResizeMode(STRETCH)
+            raw_data_container_layout.addWidget(table)
+            setattr(self, attr, table)
+        
         raw_data_scroll.setWidget(raw_data_container)
         raw_data_layout.addWidget(raw_data_scroll)
-        self.raw_data_tab.setLayout(raw_data_layout)
-        self.detail_tabs.addTab(self.raw_data_tab, "Raw Financial Data")
-        
-        # Tab 2: FCF Calculation Breakdown
-        self.fcf_tab = QWidget()
-        fcf_layout = QVBoxLayout()
-        fcf_layout.setContentsMargins(5, 5, 5, 5)
-        fcf_scroll = QScrollArea()
-        fcf_scroll.setWidgetResizable(True)
-        fcf_scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        fcf_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        fcf_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        fcf_container = QWidget()
-        fcf_container_layout = QVBoxLayout()
-        
-        fcf_explanation = QLabel(
+    
+    def _build_fcf_tab(self, page):
+        """FCF Calculation Breakdown tab"""
+        self.fcf_tab = page
+        self.fcf_calc_table = self._make_table_tab(
+            page,
             "Free Cash Flow (FCF) Calculation:\n\n"
             "FCF = Operating Cash Flow - Capital Expenditures\n\n"
             "Operating Cash Flow: Cash generated from core business operations\n"
             "Capital Expenditures: Cash spent on long-term assets (PP&E)\n\n"
-            "FCF represents the cash available to shareholders after reinvesting in the business."
+            "FCF represents the cash available to shareholders after reinvesting in the business.",
+            ["Year", "Operating CF", "Capital Expenditures", "FCF Calculation", "FCF Result"],
+            (FIT, STRETCH, STRETCH, STRETCH, STRETCH),
         )
-        fcf_explanation.setWordWrap(True)
-        fcf_explanation.setFont(QFont("", 10))
-        fcf_container_layout.addWidget(fcf_explanation)
-        
-        self.fcf_calc_table = QTableWidget()
-        self.fcf_calc_table.setAlternatingRowColors(True)
-        self.fcf_calc_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.fcf_calc_table.setMinimumHeight(200)
-        self.fcf_calc_table.horizontalHeader().setStretchLastSection(False)
-        self.fcf_calc_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.fcf_calc_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.fcf_calc_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.fcf_calc_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
-        self.fcf_calc_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
-        fcf_container_layout.addWidget(self.fcf_calc_table)
-        
-        fcf_container.setLayout(fcf_container_layout)
-        fcf_scroll.setWidget(fcf_container)
-        fcf_layout.addWidget(fcf_scroll)
-        self.fcf_tab.setLayout(fcf_layout)
-        self.detail_tabs.addTab(self.fcf_tab, "FCF Calculation")
-        
-        # Tab 3: Growth Rate Calculation
-        self.growth_tab = QWidget()
-        growth_layout = QVBoxLayout()
-        growth_layout.setContentsMargins(5, 5, 5, 5)
-        growth_scroll = QScrollArea()
-        growth_scroll.setWidgetResizable(True)
-        growth_scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        growth_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        growth_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        growth_container = QWidget()
-        growth_container_layout = QVBoxLayout()
-        
-        growth_explanation = QLabel(
+    
+    def _build_growth_tab(self, page):
+        """Growth Rate Calculation tab"""
+        self.growth_tab = page
+        self.growth_calc_table = self._make_table_tab(
+            page,
             "Growth Rate Calculation:\n\n"
             "The growth rate estimates how fast the company's free cash flow will grow.\n"
             "Different methods provide different perspectives:\n\n"
             "• Average: Mean of year-over-year growth rates (most stable)\n"
             "• CAGR: Compound Annual Growth Rate over the period (smoother)\n"
             "• Recent: Latest year-over-year growth (most current)\n\n"
-            "A high growth rate increases valuation, but should be realistic."
+            "A high growth rate increases valuation, but should be realistic.",
+            ["Year", "FCF (Year N)", "FCF (Year N-1)", "Growth Calculation", "Growth Rate"],
+            (FIT, STRETCH, STRETCH, STRETCH, FIT),
         )
-        growth_explanation.setWordWrap(True)
-        growth_explanation.setFont(QFont("", 10))
-        growth_container_layout.addWidget(growth_explanation)
-        
-        self.growth_calc_table = QTableWidget()
-        self.growth_calc_table.setAlternatingRowColors(True)
-        self.growth_calc_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.growth_calc_table.setMinimumHeight(200)
-        self.growth_calc_table.horizontalHeader().setStretchLastSection(False)
-        self.growth_calc_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.growth_calc_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.growth_calc_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.growth_calc_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
-        self.growth_calc_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        growth_container_layout.addWidget(self.growth_calc_table)
-        
-        growth_container.setLayout(growth_container_layout)
-        growth_scroll.setWidget(growth_container)
-        growth_layout.addWidget(growth_scroll)
-        self.growth_tab.setLayout(growth_layout)
-        self.detail_tabs.addTab(self.growth_tab, "Growth Rate")
-        
-        # Tab 4: WACC Calculation
-        self.wacc_tab = QWidget()
-        wacc_layout = QVBoxLayout()
-        wacc_layout.setContentsMargins(5, 5, 5, 5)
-        wacc_scroll = QScrollArea()
-        wacc_scroll.setWidgetResizable(True)
-        wacc_scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        wacc_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        wacc_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        wacc_container = QWidget()
-        wacc_container_layout = QVBoxLayout()
-        
-        wacc_explanation = QLabel(
+    
+    def _build_wacc_tab(self, page):
+        """WACC Calculation tab"""
+        self.wacc_tab = page
+        self.wacc_calc_table = self._make_table_tab(
+            page,
             "Weighted Average Cost of Capital (WACC) Calculation:\n\n"
             "WACC = (E/V × Re) + (D/V × Rd × (1 - Tc))\n\n"
             "Where:\n"
@@ -254,40 +619,16 @@ class DetailedBreakdownDialog(QDialog):
             "• Re = Cost of equity (using CAPM: Rf + β × (Rm - Rf))\n"
             "• Rd = Cost of debt (interest expense / total debt)\n"
             "• Tc = Tax rate\n\n"
-            "WACC represents the average rate a company pays to finance its assets."
+            "WACC represents the average rate a company pays to finance its assets.",
+            ["Component", "Value", "Explanation"],
+            (FIT, FIT), stretch_last=True,
         )
-        wacc_explanation.setWordWrap(True)
-        wacc_explanation.setFont(QFont("", 10))
-        wacc_container_layout.addWidget(wacc_explanation)
-        
-        self.wacc_calc_table = QTableWidget()
-        self.wacc_calc_table.setAlternatingRowColors(True)
-        self.wacc_calc_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.wacc_calc_table.setMinimumHeight(200)
-        self.wacc_calc_table.horizontalHeader().setStretchLastSection(True)
-        self.wacc_calc_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.wacc_calc_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        wacc_container_layout.addWidget(self.wacc_calc_table)
-        
-        wacc_container.setLayout(wacc_container_layout)
-        wacc_scroll.setWidget(wacc_container)
-        wacc_layout.addWidget(wacc_scroll)
-        self.wacc_tab.setLayout(wacc_layout)
-        self.detail_tabs.addTab(self.wacc_tab, "WACC Calculation")
-        
-        # Tab 5: DCF Step-by-Step
-        self.dcf_steps_tab = QWidget()
-        dcf_steps_layout = QVBoxLayout()
-        dcf_steps_layout.setContentsMargins(5, 5, 5, 5)
-        dcf_steps_scroll = QScrollArea()
-        dcf_steps_scroll.setWidgetResizable(True)
-        dcf_steps_scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        dcf_steps_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        dcf_steps_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        dcf_steps_container = QWidget()
-        dcf_steps_container_layout = QVBoxLayout()
-        
-        dcf_explanation = QLabel(
+    
+    def _build_dcf_steps_tab(self, page):
+        """DCF Step-by-Step tab"""
+        self.dcf_steps_tab = page
+        self.dcf_steps_table = self._make_table_tab(
+            page,
             "DCF Calculation Steps:\n\n"
             "1. Project Future FCFs: Apply growth rate to current FCF for 10 years\n"
             "2. Discount to Present: Divide each year's FCF by (1 + WACC)^year\n"
@@ -296,74 +637,21 @@ class DetailedBreakdownDialog(QDialog):
             "4. Discount Terminal Value: Bring back to present value\n"
             "5. Sum Everything: Enterprise Value = Sum of Discounted FCFs + Discounted Terminal Value\n"
             "6. Calculate Equity Value: Enterprise Value - Net Debt\n"
-            "7. Value Per Share: Equity Value / Shares Outstanding"
+            "7. Value Per Share: Equity Value / Shares Outstanding",
+            ["Step", "Description", "Calculation", ""],
+            (FIT, FIT, STRETCH, FIT), min_height=300,
         )
-        dcf_explanation.setWordWrap(True)
-        dcf_explanation.setFont(QFont("", 10))
-        dcf_steps_container_layout.addWidget(dcf_explanation)
-        
-        self.dcf_steps_table = QTableWidget()
-        self.dcf_steps_table.setAlternatingRowColors(True)
-        self.dcf_steps_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.dcf_steps_table.setMinimumHeight(300)
-        self.dcf_steps_table.horizontalHeader().setStretchLastSection(False)
-        self.dcf_steps_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.dcf_steps_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.dcf_steps_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.dcf_steps_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        dcf_steps_container_layout.addWidget(self.dcf_steps_table)
-        
-        dcf_steps_container.setLayout(dcf_steps_container_layout)
-        dcf_steps_scroll.setWidget(dcf_steps_container)
-        dcf_steps_layout.addWidget(dcf_steps_scroll)
-        self.dcf_steps_tab.setLayout(dcf_steps_layout)
-        self.detail_tabs.addTab(self.dcf_steps_tab, "DCF Steps")
-        
-        # Tab 6: All Assumptions
-        self.assumptions_tab = QWidget()
-        assumptions_detailed_layout = QVBoxLayout()
-        assumptions_detailed_layout.setContentsMargins(5, 5, 5, 5)
-        assumptions_scroll = QScrollArea()
-        assumptions_scroll.setWidgetResizable(True)
-        assumptions_scroll.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        assumptions_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        assumptions_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        assumptions_container = QWidget()
-        assumptions_container_layout = QVBoxLayout()
-        
-        assumptions_explanation = QLabel(
+    
+    def _build_assumptions_tab(self, page):
+        """All Assumptions tab"""
+        self.assumptions_tab = page
+        self.assumptions_table = self._make_table_tab(
+            page,
             "All Assumptions Used in This Calculation:\n\n"
-            "Understanding assumptions is crucial. Small changes can significantly impact valuation."
+            "Understanding assumptions is crucial. Small changes can significantly impact valuation.",
+            ["Assumption", "Value", "Note"],
+            (FIT,), stretch_last=True,
         )
-        assumptions_explanation.setWordWrap(True)
-        assumptions_explanation.setFont(QFont("", 10))
-        assumptions_container_layout.addWidget(assumptions_explanation)
-        
-        self.assumptions_table = QTableWidget()
-        self.assumptions_table.setAlternatingRowColors(True)
-        self.assumptions_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.assumptions_table.setMinimumHeight(200)
-        self.assumptions_table.horizontalHeader().setStretchLastSection(True)
-        self.assumptions_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        assumptions_container_layout.addWidget(self.assumptions_table)
-        
-        assumptions_container.setLayout(assumptions_container_layout)
-        assumptions_scroll.setWidget(assumptions_container)
-        assumptions_detailed_layout.addWidget(assumptions_scroll)
-        self.assumptions_tab.setLayout(assumptions_detailed_layout)
-        self.detail_tabs.addTab(self.assumptions_tab, "All Assumptions")
-        
-        main_layout.addWidget(self.detail_tabs)
-        
-        # Close button at bottom
-        button_layout = QHBoxLayout()
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        close_btn.setMinimumHeight(35)
-        button_layout.addStretch()
-        button_layout.addWidget(close_btn)
-        button_layout.addStretch()
-        main_layout.addLayout(button_layout)
 
 
 class DCFApp(QMainWindow):
@@ -377,12 +665,6 @@ class DCFApp(QMainWindow):
         self.resize(1200, 900)
         self.setGeometry(100, 100, 1200, 900)
         
-        # Set up locale for formatting
-        try:
-            locale.setlocale(locale.LC_ALL, 'en_US.UTF-8')
-        except:
-            pass
-        
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -393,10 +675,7 @@ class DCFApp(QMainWindow):
         
         # Title
         title = QLabel("Discounted Cash Flow Calculator")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(app_font(18, bold=True))
         title.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title)
         
@@ -404,18 +683,13 @@ class DCFApp(QMainWindow):
         ticker_group = QGroupBox("Enter Company Ticker")
         ticker_layout = QHBoxLayout()
         ticker_label = QLabel("Ticker Symbol:")
-        ticker_label_font = QFont()
-        ticker_label_font.setPointSize(11)
-        ticker_label_font.setBold(True)
-        ticker_label.setFont(ticker_label_font)
+        ticker_label.setFont(app_font(11, bold=True))
         ticker_layout.addWidget(ticker_label)
         self.ticker_input = QLineEdit()
         self.ticker_input.setPlaceholderText("e.g., AAPL, MSFT, GOOGL")
         self.ticker_input.setMinimumWidth(200)
         self.ticker_input.setMaximumWidth(250)
-        ticker_font = QFont()
-        ticker_font.setPointSize(12)
-        self.ticker_input.setFont(ticker_font)
+        self.ticker_input.setFont(app_font(12))
         ticker_layout.addWidget(self.ticker_input)
         ticker_layout.addStretch()
         ticker_group.setLayout(ticker_layout)
@@ -517,10 +791,7 @@ class DCFApp(QMainWindow):
         self.calculate_btn = QPushButton("Calculate DCF")
         self.calculate_btn.setMinimumHeight(40)
         self.calculate_btn.clicked.connect(self.calculate_dcf)
-        calculate_font = QFont()
-        calculate_font.setPointSize(12)
-        calculate_font.setBold(True)
-        self.calculate_btn.setFont(calculate_font)
+        self.calculate_btn.setFont(app_font(12, bold=True))
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -546,22 +817,15 @@ class DCFApp(QMainWindow):
         
         # Summary metrics grid
         summary_label = QLabel("Summary Metrics")
-        summary_font = QFont()
-        summary_font.setPointSize(11)
-        summary_font.setBold(True)
+        summary_font = app_font(11, bold=True)
         summary_label.setFont(summary_font)
         results_container_layout.addWidget(summary_label)
         
-        self.summary_table = QTableWidget()
-        self.summary_table.setColumnCount(2)
-        self.summary_table.setHorizontalHeaderLabels(["Metric", "Value"])
+        self.summary_table = make_table_view(["Metric", "Value"])
         self.summary_table.horizontalHeader().setStretchLastSection(True)
-        self.summary_table.horizontalHeader().setVisible(True)
-        self.summary_table.verticalHeader().setVisible(False)
         self.summary_table.setMinimumHeight(150)
         self.summary_table.setAlternatingRowColors(True)
-        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.summary_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.summary_table.setSelectionBehavior(QTableView.SelectRows)
         results_container_layout.addWidget(self.summary_table)
         
         # Projected cash flows table
@@ -569,22 +833,12 @@ class DCFApp(QMainWindow):
         projections_label.setFont(summary_font)
         results_container_layout.addWidget(projections_label)
         
-        self.projections_table = QTableWidget()
-        self.projections_table.setColumnCount(4)
-        self.projections_table.setHorizontalHeaderLabels(["Year", "FCF", "Discount Factor", "Discounted FCF"])
-        self.projections_table.horizontalHeader().setStretchLastSection(True)
-        self.projections_table.horizontalHeader().setVisible(True)
-        self.projections_table.verticalHeader().setVisible(False)
-        header = self.projections_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        self.projections_table = make_table_view(["Year", "FCF", "Discount Factor", "Discounted FCF"])
+        configure_header(self.projections_table, (FIT, STRETCH, FIT, STRETCH), stretch_last=True)
         self.projections_table.setMinimumHeight(250)
         self.projections_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.projections_table.setAlternatingRowColors(True)
-        self.projections_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.projections_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.projections_table.setSelectionBehavior(QTableView.SelectRows)
         results_container_layout.addWidget(self.projections_table)
         
         # Valuation comparison
@@ -592,16 +846,11 @@ class DCFApp(QMainWindow):
         valuation_label.setFont(summary_font)
         results_container_layout.addWidget(valuation_label)
         
-        self.valuation_table = QTableWidget()
-        self.valuation_table.setColumnCount(2)
-        self.valuation_table.setHorizontalHeaderLabels(["Item", "Value"])
+        self.valuation_table = make_table_view(["Item", "Value"])
         self.valuation_table.horizontalHeader().setStretchLastSection(True)
-        self.valuation_table.horizontalHeader().setVisible(True)
-        self.valuation_table.verticalHeader().setVisible(False)
         self.valuation_table.setMinimumHeight(120)
         self.valuation_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         self.valuation_table.setAlternatingRowColors(True)
-        self.valuation_table.setEditTriggers(QTableWidget.NoEditTriggers)
         results_container_layout.addWidget(self.valuation_table)
         
         scroll_area.setWidget(results_container)
@@ -616,10 +865,7 @@ class DCFApp(QMainWindow):
         self.detailed_breakdown_btn.setVisible(False)  # Only show after calculation
         self.detailed_breakdown_btn.setMinimumHeight(40)
         self.detailed_breakdown_btn.setMaximumHeight(40)
-        btn_font = QFont()
-        btn_font.setPointSize(11)
-        btn_font.setBold(True)
-        self.detailed_breakdown_btn.setFont(btn_font)
+        self.detailed_breakdown_btn.setFont(app_font(11, bold=True))
         results_layout.addWidget(self.detailed_breakdown_btn)
         
         results_group.setLayout(results_layout)
@@ -635,8 +881,37 @@ class DCFApp(QMainWindow):
         close_btn.clicked.connect(self.close)
         main_layout.addWidget(close_btn)
         
+        # Pooled worker threads for calculations (reused across clicks, bounded concurrency)
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(2)
+        
+        # Detailed breakdown dialog is created on first open and reused afterwards
+        self._detail_dialog = None
+        self._detail_result = None
+        
+        # Inputs (and day) of the calculation in flight and of the results on screen,
+        # so resubmitting unchanged inputs doesn't recalculate
+        self._pending_inputs = None
+        self._shown_inputs = None
+        
+        # Once results are shown, editing an assumption recalculates - debounced so a
+        # burst of arrow clicks or keystrokes only runs one calculation
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(250)
+        self._recalc_timer.timeout.connect(self.on_recalc_timeout)
+        for spin_box in (self.manual_growth_rate, self.discount_rate, self.risk_free_rate,
+                         self.market_risk_premium, self.terminal_growth_rate):
+            spin_box.valueChanged.connect(self.schedule_recalc)
+        # Switching growth method or auto/manual WACC changes the inputs just the same
+        for combo in (self.growth_method, self.auto_wacc):
+            combo.currentIndexChanged.connect(self.schedule_recalc)
+        
         # Initialize state
         self.on_wacc_method_changed(0)
+        
+        # Compile the numeric kernels in the background before the first click
+        self.thread_pool.start(WarmupTask())
     
     def open_detailed_breakdown(self):
         """Open detailed breakdown in a popup window"""
@@ -645,24 +920,42 @@ class DCFApp(QMainWindow):
             return
         
         # Create dialog
-        try:
-            dialog = DetailedBreakdownDialog(self)
-        except Exception as e:
-            import traceback
-            QMessageBox.critical(self, "Error", f"Failed to create dialog:\n{str(e)}")
-            return
+        if self._detail_dialog is None:
+            try:
+                self._detail_dialog = DetailedBreakdownDialog(self)
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Failed to create dialog:\n{str(e)}")
+                return
+        dialog = self._detail_dialog
         
-        # Populate the dialog's tables
-        try:
-            self.populate_detailed_breakdown(self.result_data, self.calculator, dialog)
-        except Exception as e:
-            import traceback
-            # Still show the dialog even if population failed
-            QMessageBox.warning(self, "Warning", f"Some data may be incomplete:\n{str(e)}")
+        # Populate the dialog's tables (only when the results changed since the last open)
+        if self._detail_result is not self.result_data:
+            self._detail_result = self.result_data
+            try:
+                self.populate_detailed_breakdown(self.result_data, self.calculator, dialog)
+            except Exception as e:
+                # Still show the dialog even if population failed
+                QMessageBox.warning(self, "Warning", f"Some data may be incomplete:\n{str(e)}")
         
         # Show dialog (modal)
         dialog.exec()
     
+    def schedule_recalc(self, *_):
+        """Restart the recalculation debounce timer if there are results to refresh"""
+        if self._shown_inputs is not None:
+            self._recalc_timer.start()
+    
+    def on_recalc_timeout(self):
+        """Recalculate with the edited assumptions (waits for a running calculation first)"""
+        if not self.calculate_btn.isEnabled():
+            self._recalc_timer.start()
+            return
+        if self._shown_inputs is None:
+            return  # The last calculation failed; nothing on screen to refresh
+        # Refresh the company on screen, not whatever is half-typed in the ticker field
+        shown, _ = self._shown_inputs
+        self._start_calculation(shown.ticker)
+    
     def on_growth_method_changed(self, index):
         """Show/hide manual growth rate input"""
         self.manual_growth_rate.setVisible(index == 3)  # "Manual Entry"
@@ -681,19 +974,12 @@ class DCFApp(QMainWindow):
         if not ticker:
             QMessageBox.warning(self, "Error", "Please enter a company ticker")
             return
-        
-        # Disable calculate button and show progress
-        self.calculate_btn.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate
-        
-        # Clear main result tables
-        self.summary_table.setRowCount(0)
-        self.projections_table.setRowCount(0)
-        self.valuation_table.setRowCount(0)
-        
-        # Hide detailed breakdown button
-        self.detailed_breakdown_btn.setVisible(False)
+        self._start_calculation(ticker)
+    
+    def _start_calculation(self, ticker):
+        """Calculate ticker's DCF with the current assumptions in a worker thread"""
+        # This run picks up any assumption edits still waiting on the debounce timer
+        self._recalc_timer.stop()
         
         # Get inputs
         growth_method_map = {
@@ -714,8 +1000,7 @@ class DCFApp(QMainWindow):
         if self.auto_wacc.currentIndex() == 1:  # Manual
             discount_rate = self.discount_rate.value() / 100.0
         
-        # Create and start worker thread
-        self.worker = DCFWorker(
+        inputs = CalculationInputs(
             ticker=ticker,
             growth_method=growth_method,
             growth_rate=manual_growth,
@@ -724,666 +1009,286 @@ class DCFApp(QMainWindow):
             market_risk_premium=self.market_risk_premium.value() / 100.0,
             terminal_growth_rate=self.terminal_growth_rate.value() / 100.0
         )
+        # The tables already show these exact inputs (data is refetched daily, like _CALC_CACHE)
+        if (inputs, date.today()) == self._shown_inputs:
+            return
+        self._pending_inputs = (inputs, date.today())
+        
+        # Disable calculate button and show progress
+        self.calculate_btn.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate
         
-        self.worker.finished.connect(self.on_calculation_complete)
-        self.worker.error.connect(self.on_calculation_error)
-        self.worker.start()
+        # Grey out the previous results; they are updated in place when the new ones arrive
+        for table in (self.summary_table, self.projections_table, self.valuation_table):
+            table.setEnabled(False)
+        
+        # Hide detailed breakdown button
+        self.detailed_breakdown_btn.setVisible(False)
+        
+        # Queue the calculation on the worker pool
+        self.worker = DCFWorker(*inputs)
+        
+        self.worker.signals.finished.connect(self.on_calculation_complete)
+        self.worker.signals.error.connect(self.on_calculation_error)
+        self.thread_pool.start(self.worker)
     
     def format_currency(self, value):
         """Format number as currency"""
-        try:
-            return locale.currency(value, grouping=True)
-        except:
-            return f"${value:,.2f}"
+        return format_money(value)
     
     def format_currency_table(self, value):
         """Format number as currency for table display"""
-        import math
-        import pandas as pd
-        
-        # Check for NaN or None values
-        if value is None:
-            return "N/A"
-        if pd.isna(value) if hasattr(pd, 'isna') else (value != value):
-            return "N/A"
-        if isinstance(value, (int, float)) and (math.isnan(value) or math.isinf(value)):
-            return "N/A"
-        
-        try:
-            # Ensure value is numeric
-            value = float(value)
-            formatted = locale.currency(value, grouping=True, symbol=True)
-            return formatted
-        except (ValueError, TypeError, OverflowError):
-            return "N/A"
+        return format_money_cell(value)
     
     def on_calculation_complete(self, result):
         """Display DCF calculation results in tables"""
         try:
-            self.progress_bar.setVisible(False)
-            self.calculate_btn.setEnabled(True)
-            self.detailed_breakdown_btn.setVisible(True)
-            
-            # Extract calculator from result
-            calc = result.pop('_calculator', None)
-            if calc is None:
-                QMessageBox.critical(self, "Error", "Calculator object not found in results")
-                return
-            
-            # Store calculator for detailed view
-            self.calculator = calc
-            self.result_data = result
-            
-            # Data is stored and will be populated when dialog opens
-            
-            # Populate Summary Metrics Table
-            summary_data = [
-                ("Company", self.ticker_input.text().upper()),
-                ("Current FCF", self.format_currency_table(result['current_fcf'])),
-                ("Growth Rate", f"{result['growth_rate']*100:.2f}%"),
-                ("Discount Rate (WACC)", f"{result['discount_rate']*100:.2f}%"),
-                ("Terminal Growth Rate", f"{result['terminal_growth_rate']*100:.2f}%"),
-                ("Shares Outstanding", f"{result['shares_outstanding']:,.0f}"),
-            ]
-            
-            self.summary_table.setRowCount(len(summary_data))
-            for row, (metric, value) in enumerate(summary_data):
-                metric_item = QTableWidgetItem(metric)
-                metric_item.setFont(QFont("", 9, QFont.Bold))
-                self.summary_table.setItem(row, 0, metric_item)
-                self.summary_table.setItem(row, 1, QTableWidgetItem(str(value)))
-            
-            # Populate Projected Cash Flows Table
-            self.projections_table.setRowCount(len(result['projected_fcf']) + 1)  # +1 for total row
-            
-            import math
-            for row, year_data in enumerate(result['projected_fcf']):
-                year = year_data.get('year', row + 1)
-                fcf = year_data.get('fcf', 0)
-                discount_rate = result.get('discount_rate', 0.1)
-                
-                # Calculate discount factor safely
-                if discount_rate > 0 and not math.isnan(discount_rate):
-                    discount_factor = 1 / ((1 + discount_rate) ** year)
-                else:
-                    discount_factor = 1.0
-                
-                discounted_fcf = year_data.get('discounted_fcf', 0)
-                
-                # Check for NaN values
-                if math.isnan(fcf) or math.isnan(discounted_fcf) or math.isnan(discount_factor):
-                    self.projections_table.setItem(row, 0, QTableWidgetItem(f"Year {year}"))
-                    self.projections_table.setItem(row, 1, QTableWidgetItem("N/A"))
-                    self.projections_table.setItem(row, 2, QTableWidgetItem("N/A"))
-                    self.projections_table.setItem(row, 3, QTableWidgetItem("N/A"))
-                else:
-                    self.projections_table.setItem(row, 0, QTableWidgetItem(f"Year {year}"))
-                    self.projections_table.setItem(row, 1, QTableWidgetItem(self.format_currency_table(fcf)))
-                    self.projections_table.setItem(row, 2, QTableWidgetItem(f"{discount_factor:.4f}"))
-                    self.projections_table.setItem(row, 3, QTableWidgetItem(self.format_currency_table(discounted_fcf)))
-                    
-                    # Right-align currency columns
-                    for col in [1, 3]:
-                        item = self.projections_table.item(row, col)
-                        if item:
-                            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            # Add total row
-            total_row = len(result['projected_fcf'])
-            sum_discounted_fcf = sum([
-                year.get('discounted_fcf', 0) for year in result['projected_fcf']
-                if not math.isnan(year.get('discounted_fcf', 0))
-            ])
-            
-            # Use darker background for better visibility
-            total_bg_color = QColor(170, 170, 170)  # Darker gray - more visible than white
-            
-            total_item = QTableWidgetItem("Total (Discounted FCF)")
-            total_item.setFont(QFont("", 9, QFont.Bold))
-            total_item.setBackground(QBrush(total_bg_color))
-            total_item.setForeground(QBrush(QColor(0, 0, 0)))  # Black text
-            self.projections_table.setItem(total_row, 0, total_item)
-            
-            empty_item = QTableWidgetItem("")
-            empty_item.setBackground(QBrush(total_bg_color))
-            self.projections_table.setItem(total_row, 1, empty_item)
-            
-            empty_item2 = QTableWidgetItem("")
-            empty_item2.setBackground(QBrush(total_bg_color))
-            self.projections_table.setItem(total_row, 2, empty_item2)
-            
-            total_value = QTableWidgetItem(self.format_currency_table(sum_discounted_fcf))
-            total_value.setFont(QFont("", 9, QFont.Bold))
-            total_value.setBackground(QBrush(total_bg_color))
-            total_value.setForeground(QBrush(QColor(0, 0, 0)))  # Black text
-            total_value.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.projections_table.setItem(total_row, 3, total_value)
-            
-            # Populate Valuation Table
-            valuation_data = [
-                ("Terminal Value", self.format_currency_table(result['terminal_value'])),
-                ("Discounted Terminal Value", self.format_currency_table(result['discounted_terminal_value'])),
-                ("Enterprise Value", self.format_currency_table(result['enterprise_value'])),
-                ("Net Debt", self.format_currency_table(result['net_debt'])),
-                ("Equity Value", self.format_currency_table(result['equity_value'])),
-                ("Value Per Share", self.format_currency_table(result['per_share_value'])),
-            ]
-            
-            # Add current price and comparison
-            valuation_data.append(("", ""))  # Separator
-            valuation_data.append(("Current Market Price", self.format_currency_table(result['current_price'])))
-            
-            # Check for valid current price and per share value
-            current_price = result.get('current_price', 0) or 0
-            per_share_value = result.get('per_share_value', 0) or 0
-            
-            import math
-            if current_price > 0 and not math.isnan(current_price) and not math.isnan(per_share_value):
-                premium = ((per_share_value - current_price) / current_price) * 100
-                if not math.isnan(premium):
-                    valuation_data.append(("Premium/(Discount)", f"{premium:+.2f}%"))
-                    
-                    if premium > 0:
-                        valuation_data.append(("Assessment", f"UNDERVALUED by {premium:.2f}%"))
-                        assessment_color = QColor(200, 255, 200)  # Light green
-                    else:
-                        valuation_data.append(("Assessment", f"OVERVALUED by {abs(premium):.2f}%"))
-                        assessment_color = QColor(255, 200, 200)  # Light red
-                else:
-                    valuation_data.append(("Premium/(Discount)", "N/A"))
-                    valuation_data.append(("Assessment", "Calculation error"))
-                    assessment_color = QColor(230, 230, 230)
-            else:
-                valuation_data.append(("Premium/(Discount)", "N/A"))
-                valuation_data.append(("Assessment", "Price data unavailable"))
-                assessment_color = QColor(230, 230, 230)
-            
-            self.valuation_table.setRowCount(len(valuation_data))
-            assessment_row = None
-            for row, (item, value) in enumerate(valuation_data):
-                item_widget = QTableWidgetItem(item)
-                if item:
-                    item_widget.setFont(QFont("", 9, QFont.Bold if row < len(valuation_data) - 3 else QFont.Normal))
-                self.valuation_table.setItem(row, 0, item_widget)
-                
-                value_item = QTableWidgetItem(str(value))
-                if value and "$" in str(value):
-                    value_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                if "UNDERVALUED" in str(value) or "OVERVALUED" in str(value):
-                    # Use darker background for better visibility
-                    if assessment_color == QColor(200, 255, 200):  # Light green
-                        darker_color = QColor(120, 180, 120)  # Darker green - more visible
-                    elif assessment_color == QColor(255, 200, 200):  # Light red
-                        darker_color = QColor(180, 120, 120)  # Darker red - more visible
-                    else:
-                        darker_color = QColor(170, 170, 170)  # Gray
-                    value_item.setBackground(QBrush(darker_color))
-                    value_item.setForeground(QBrush(QColor(0, 0, 0)))  # Black text for visibility
-                    
-                    # Also set darker background on label column
-                    if item_widget:
-                        item_widget.setBackground(QBrush(darker_color))
-                        item_widget.setForeground(QBrush(QColor(0, 0, 0)))
-                    
-                    assessment_row = row
-                self.valuation_table.setItem(row, 1, value_item)
-                
+            # Repaint once after all result tables are filled, not after each reset
+            with updates_suspended(self):
+                self._show_results(result)
         except Exception as e:
-            import traceback
             error_msg = f"Error displaying results: {str(e)}"
             QMessageBox.critical(self, "Display Error", f"Unable to display results:\n\n{error_msg}")
     
-    def populate_detailed_breakdown(self, result, calc, dialog):
-        """Populate all detailed breakdown tables with educational content"""
-        import pandas as pd
+    def _show_results(self, result):
+        """Fill the summary, projection and valuation tables from a calculation result"""
+        self.progress_bar.setVisible(False)
+        self.calculate_btn.setEnabled(True)
+        self.detailed_breakdown_btn.setVisible(True)
+        for table in (self.summary_table, self.projections_table, self.valuation_table):
+            table.setEnabled(True)
+        
+        # Extract calculator from result
+        calc = result.pop('_calculator', None)
+        if calc is None:
+            QMessageBox.critical(self, "Error", "Calculator object not found in results")
+            return
         
-        # Wrap each population in try-except so one failure doesn't break others
-        try:
-            self.populate_raw_financial_data(calc, dialog)
-        except Exception as e:
-            import traceback
-            print(f"Error populating raw financial data: {e}")
-            traceback.print_exc()
+        # Store calculator for detailed view
+        self.calculator = calc
+        self.result_data = result
         
-        try:
-            self.populate_fcf_calculation(calc, dialog)
-        except Exception as e:
-            import traceback
-            print(f"Error populating FCF calculation: {e}")
-            traceback.print_exc()
+        # Data is stored and will be populated when dialog opens
         
-        try:
-            self.populate_growth_calculation(calc, result, dialog)
-        except Exception as e:
-            import traceback
-            print(f"Error populating growth calculation: {e}")
-            traceback.print_exc()
+        # Populate Summary Metrics Table
+        # The ticker the results were calculated for (the input field may already hold another)
+        summary_data = [("Company", calc.ticker)]
+        summary_data += schema_rows(_SUMMARY_SCHEMA, result)
         
-        try:
-            self.populate_wacc_calculation(calc, result, dialog)
-        except Exception as e:
-            import traceback
-            print(f"Error populating WACC calculation: {e}")
-            traceback.print_exc()
+        self.summary_table.model().set_rows(
+            summary_data, styles={(row, 0): BOLD for row in range(len(summary_data))})
         
-        try:
-            self.populate_dcf_steps(result, dialog)
-        except Exception as e:
-            import traceback
-            print(f"Error populating DCF steps: {e}")
-            traceback.print_exc()
+        # Populate Projected Cash Flows Table
+        projection_rows = []
+        projection_styles = {}
         
-        try:
-            self.populate_assumptions(result, dialog)
-        except Exception as e:
-            import traceback
-            print(f"Error populating assumptions: {e}")
-            traceback.print_exc()
-    
-    def populate_raw_financial_data(self, calc, dialog):
-        """Populate raw financial statements"""
-        import pandas as pd
-        
-        # Cash Flow Statement - search flexibly for items
-        if calc.cashflow is not None and len(calc.cashflow.columns) > 0:
-            # First try exact matches
-            key_items = ['Operating Cash Flow', 'Total Cash From Operating Activities',
-                         'Capital Expenditure', 'Capital Expenditures', 'Free Cash Flow',
-                         'Total Cashflows From Operating Activities', 'Cash And Cash Equivalents At End Of Period']
-            available_items = [item for item in key_items if item in calc.cashflow.index]
-            
-            # If we don't have enough items, search more flexibly
-            if len(available_items) < 3:
-                # Search by keywords in index names
-                all_items = list(calc.cashflow.index)
-                keywords = {
-                    'operating': ['operating', 'cash from operating', 'operating activities'],
-                    'capital': ['capital expenditure', 'capex', 'capital expenditures'],
-                    'free': ['free cash flow'],
-                    'total': ['total cash']
-                }
-                
-                for keyword_list in keywords.values():
-                    for item in all_items:
-                        item_lower = str(item).lower()
-                        if any(kw in item_lower for kw in keyword_list):
-                            if item not in available_items:
-                                available_items.append(item)
-                                break
-                
-                # Limit to 8 most relevant items
-                available_items = available_items[:8]
-            
-            if available_items and len(available_items) > 0:
-                num_cols = min(4, len(calc.cashflow.columns)) + 1  # +1 for item name column, show up to 4 years
-                dialog.cashflow_table.setColumnCount(num_cols)
-                dialog.cashflow_table.setRowCount(len(available_items))
-                
-                # Set headers - first column is "Item", rest are years
-                headers = ["Item"]
-                for i, col in enumerate(calc.cashflow.columns[:min(4, len(calc.cashflow.columns))]):
-                    # Format date column header properly
-                    if hasattr(col, 'year'):
-                        headers.append(f"{col.year}")
-                    elif hasattr(col, 'strftime'):
-                        try:
-                            headers.append(col.strftime('%Y'))
-                        except:
-                            headers.append(str(col)[:10])
-                    else:
-                        col_str = str(col)
-                        headers.append(col_str[:12] if len(col_str) > 12 else col_str)
-                dialog.cashflow_table.setHorizontalHeaderLabels(headers)
-                dialog.cashflow_table.horizontalHeader().setVisible(True)
-                dialog.cashflow_table.verticalHeader().setVisible(False)
-                
-                for row, item in enumerate(available_items):
-                    item_name = str(item)
-                    # Truncate item name if too long, but show full name on hover
-                    display_name = item_name[:40] + "..." if len(item_name) > 40 else item_name
-                    item_cell = QTableWidgetItem(display_name)
-                    item_cell.setToolTip(item_name)  # Show full name on hover
-                    dialog.cashflow_table.setItem(row, 0, item_cell)
-                    for col_idx in range(min(4, len(calc.cashflow.columns))):
-                        try:
-                            val = calc.cashflow.loc[item].iloc[col_idx]
-                            if pd.notna(val):
-                                # Always show value, even if zero
-                                dialog.cashflow_table.setItem(row, col_idx + 1, 
-                                    QTableWidgetItem(self.format_currency_table(val)))
-                            else:
-                                dialog.cashflow_table.setItem(row, col_idx + 1, QTableWidgetItem("N/A"))
-                        except (IndexError, KeyError):
-                            dialog.cashflow_table.setItem(row, col_idx + 1, QTableWidgetItem("N/A"))
-            else:
-                # Show message if no data found
-                dialog.cashflow_table.setColumnCount(1)
-                dialog.cashflow_table.setRowCount(1)
-                dialog.cashflow_table.setHorizontalHeaderLabels(["Message"])
-                dialog.cashflow_table.horizontalHeader().setVisible(True)
-                dialog.cashflow_table.verticalHeader().setVisible(False)
-                dialog.cashflow_table.setItem(0, 0, QTableWidgetItem("Cash flow data not available"))
-        
-        # Balance Sheet - search flexibly
-        if calc.balance_sheet is not None and len(calc.balance_sheet.columns) > 0:
-            key_items = ['Total Debt', 'Long Term Debt', 'Current Debt', 
-                        'Cash And Cash Equivalents', 'Total Assets', 'Total Liabilities',
-                        'Cash Cash Equivalents And Short Term Investments', 'Short Term Debt']
-            available_items = [item for item in key_items if item in calc.balance_sheet.index]
-            
-            # Search more flexibly if needed
-            if len(available_items) < 4:
-                all_items = list(calc.balance_sheet.index)
-                keywords = {
-                    'debt': ['total debt', 'long term debt', 'current debt', 'short term debt'],
-                    'cash': ['cash', 'cash equivalents'],
-                    'assets': ['total assets'],
-                    'liabilities': ['total liabilities', 'total liability']
-                }
-                
-                for keyword_list in keywords.values():
-                    for item in all_items:
-                        item_lower = str(item).lower()
-                        if any(kw in item_lower for kw in keyword_list):
-                            if item not in available_items:
-                                available_items.append(item)
-                                break
-                
-                available_items = available_items[:8]
+        fcf_arr = result['fcf_arr']
+        discounted_arr = result['discounted_arr']
+        discount_factors = result['discount_factors']  # 1/(1+r)^year, from the DCF kernel
+        # Years with any NaN value are shown as N/A (one mask for the whole projection)
+        valid = ~(np.isnan(fcf_arr) | np.isnan(discounted_arr) | np.isnan(discount_factors))
+        
+        fcf_text = format_money_array(fcf_arr).tolist()
+        discounted_text = format_money_array(discounted_arr).tolist()
+        
+        for row, (discount_factor, ok) in enumerate(zip(discount_factors.tolist(), valid.tolist())):
+            year = row + 1
             
-            if available_items and len(available_items) > 0:
-                num_cols = min(4, len(calc.balance_sheet.columns)) + 1
-                dialog.balance_sheet_table.setColumnCount(num_cols)
-                dialog.balance_sheet_table.setRowCount(len(available_items))
-                
-                # Set headers properly
-                headers = ["Item"]
-                for i, col in enumerate(calc.balance_sheet.columns[:min(4, len(calc.balance_sheet.columns))]):
-                    if hasattr(col, 'year'):
-                        headers.append(f"{col.year}")
-                    elif hasattr(col, 'strftime'):
-                        try:
-                            headers.append(col.strftime('%Y'))
-                        except:
-                            headers.append(str(col)[:10])
-                    else:
-                        col_str = str(col)
-                        headers.append(col_str[:12] if len(col_str) > 12 else col_str)
-                    dialog.balance_sheet_table.setHorizontalHeaderLabels(headers)
-                dialog.balance_sheet_table.horizontalHeader().setVisible(True)
-                dialog.balance_sheet_table.verticalHeader().setVisible(False)
-                
-                for row, item in enumerate(available_items):
-                    item_name = str(item)
-                    display_name = item_name[:40] + "..." if len(item_name) > 40 else item_name
-                    item_cell = QTableWidgetItem(display_name)
-                    item_cell.setToolTip(item_name)
-                    dialog.balance_sheet_table.setItem(row, 0, item_cell)
-                    for col_idx in range(min(4, len(calc.balance_sheet.columns))):
-                        try:
-                            val = calc.balance_sheet.loc[item].iloc[col_idx]
-                            if pd.notna(val):
-                                dialog.balance_sheet_table.setItem(row, col_idx + 1, 
-                                    QTableWidgetItem(self.format_currency_table(val)))
-                            else:
-                                dialog.balance_sheet_table.setItem(row, col_idx + 1, QTableWidgetItem("N/A"))
-                        except (IndexError, KeyError):
-                            dialog.balance_sheet_table.setItem(row, col_idx + 1, QTableWidgetItem("N/A"))
+            if not ok:
+                projection_rows.append((f"Year {year}", "N/A", "N/A", "N/A"))
             else:
-                dialog.balance_sheet_table.setColumnCount(1)
-                dialog.balance_sheet_table.setRowCount(1)
-                dialog.balance_sheet_table.setHorizontalHeaderLabels(["Message"])
-                dialog.balance_sheet_table.horizontalHeader().setVisible(True)
-                dialog.balance_sheet_table.verticalHeader().setVisible(False)
-                dialog.balance_sheet_table.setItem(0, 0, QTableWidgetItem("Balance sheet data not available"))
-        
-        # Income Statement - search flexibly
-        if calc.financials is not None and len(calc.financials.columns) > 0:
-            key_items = ['Total Revenue', 'Revenue', 'Net Income', 'Interest Expense', 
-                        'Operating Income', 'Operating Income Loss', 'Gross Profit', 
-                        'Cost Of Revenue', 'Income Tax Expense']
-            available_items = [item for item in key_items if item in calc.financials.index]
-            
-            # Search more flexibly if needed
-            if len(available_items) < 4:
-                all_items = list(calc.financials.index)
-                keywords = {
-                    'revenue': ['total revenue', 'revenue', 'net revenue'],
-                    'income': ['net income', 'operating income', 'income'],
-                    'interest': ['interest expense', 'interest'],
-                    'profit': ['gross profit', 'profit']
-                }
+                projection_rows.append((f"Year {year}", fcf_text[row],
+                                        f"{discount_factor:.4f}", discounted_text[row]))
                 
-                for keyword_list in keywords.values():
-                    for item in all_items:
-                        item_lower = str(item).lower()
-                        if any(kw in item_lower for kw in keyword_list):
-                            if item not in available_items:
-                                available_items.append(item)
-                                break
-                
-                available_items = available_items[:8]
-            
-            if available_items and len(available_items) > 0:
-                num_cols = min(4, len(calc.financials.columns)) + 1
-                dialog.income_table.setColumnCount(num_cols)
-                dialog.income_table.setRowCount(len(available_items))
-                
-                # Set headers properly
-                headers = ["Item"]
-                for i, col in enumerate(calc.financials.columns[:min(4, len(calc.financials.columns))]):
-                    if hasattr(col, 'year'):
-                        headers.append(f"{col.year}")
-                    elif hasattr(col, 'strftime'):
-                        try:
-                            headers.append(col.strftime('%Y'))
-                        except:
-                            headers.append(str(col)[:10])
-                    else:
-                        col_str = str(col)
-                        headers.append(col_str[:12] if len(col_str) > 12 else col_str)
-                dialog.income_table.setHorizontalHeaderLabels(headers)
-                dialog.income_table.horizontalHeader().setVisible(True)
-                dialog.income_table.verticalHeader().setVisible(False)
+                # Right-align currency columns
+                for col in [1, 3]:
+                    projection_styles[(row, col)] = RIGHT_ALIGNED
+        
+        # Add total row
+        total_row = len(discounted_arr)
+        # NaN years are left out of the total; all-NaN shows as N/A
+        sum_discounted_fcf = np.nan if np.isnan(discounted_arr).all() else np.nansum(discounted_arr)
+        
+        projection_rows.append(("Total (Discounted FCF)", "", "",
+                                self.format_currency_table(sum_discounted_fcf)))
+        projection_styles[(total_row, 0)] = CellStyle(
+            bold=True, background=TOTAL_GRAY, foreground=BLACK)
+        projection_styles[(total_row, 1)] = CellStyle(background=TOTAL_GRAY)
+        projection_styles[(total_row, 2)] = CellStyle(background=TOTAL_GRAY)
+        projection_styles[(total_row, 3)] = CellStyle(
+            bold=True, background=TOTAL_GRAY, foreground=BLACK, alignment=ALIGN_RIGHT)
+        self.projections_table.model().set_rows(projection_rows, styles=projection_styles)
+        
+        # Populate Valuation Table - styles are set as rows are added, not sniffed from the text
+        valuation_data = schema_rows(_VALUATION_SCHEMA, result)
+        valuation_styles = {}
+        for row in range(len(valuation_data)):
+            valuation_styles[(row, 0)] = BOLD
+            valuation_styles[(row, 1)] = RIGHT_ALIGNED
+        
+        # Add current price and comparison
+        valuation_data.append(("", ""))  # Separator
+        valuation_data.append(("Current Market Price", format_money_cell(result['current_price'])))
+        valuation_styles[(len(valuation_data) - 1, 1)] = RIGHT_ALIGNED
+        
+        # Check for valid current price and per share value
+        current_price = result.get('current_price', 0) or 0
+        per_share_value = result.get('per_share_value', 0) or 0
+        
+        if current_price > 0 and not math.isnan(current_price) and not math.isnan(per_share_value):
+            premium = ((per_share_value - current_price) / current_price) * 100
+            if not math.isnan(premium):
+                valuation_data.append(("Premium/(Discount)", f"{premium:+.2f}%"))
                 
-                for row, item in enumerate(available_items):
-                    item_name = str(item)
-                    display_name = item_name[:40] + "..." if len(item_name) > 40 else item_name
-                    item_cell = QTableWidgetItem(display_name)
-                    item_cell.setToolTip(item_name)
-                    dialog.income_table.setItem(row, 0, item_cell)
-                    for col_idx in range(min(4, len(calc.financials.columns))):
-                        try:
-                            val = calc.financials.loc[item].iloc[col_idx]
-                            if pd.notna(val):
-                                dialog.income_table.setItem(row, col_idx + 1, 
-                                    QTableWidgetItem(self.format_currency_table(val)))
-                            else:
-                                dialog.income_table.setItem(row, col_idx + 1, QTableWidgetItem("N/A"))
-                        except (IndexError, KeyError):
-                            dialog.income_table.setItem(row, col_idx + 1, QTableWidgetItem("N/A"))
+                if premium > 0:
+                    assessment = f"UNDERVALUED by {premium:.2f}%"
+                    assessment_color = UNDERVALUED_GREEN
+                else:
+                    assessment = f"OVERVALUED by {abs(premium):.2f}%"
+                    assessment_color = OVERVALUED_RED
+                # Black text for visibility, assessment background on both columns
+                highlight = CellStyle(background=assessment_color, foreground=BLACK)
+                valuation_styles[(len(valuation_data), 0)] = highlight
+                valuation_styles[(len(valuation_data), 1)] = highlight
+                valuation_data.append(("Assessment", assessment))
             else:
-                dialog.income_table.setColumnCount(1)
-                dialog.income_table.setRowCount(1)
-                dialog.income_table.setHorizontalHeaderLabels(["Message"])
-                dialog.income_table.horizontalHeader().setVisible(True)
-                dialog.income_table.verticalHeader().setVisible(False)
-                dialog.income_table.setItem(0, 0, QTableWidgetItem("Income statement data not available"))
+                valuation_data.append(("Premium/(Discount)", "N/A"))
+                valuation_data.append(("Assessment", "Calculation error"))
+        else:
+            valuation_data.append(("Premium/(Discount)", "N/A"))
+            valuation_data.append(("Assessment", "Price data unavailable"))
+        self.valuation_table.model().set_rows(valuation_data, styles=valuation_styles)
+        self._shown_inputs = self._pending_inputs
+    
+    def populate_detailed_breakdown(self, result, calc, dialog):
+        """Hand the dialog one populate step per tab; each runs when its tab is first shown"""
+        dialog.set_fillers([
+            ("raw financial data", lambda: self.populate_raw_financial_data(calc, dialog)),
+            ("FCF calculation", lambda: self.populate_fcf_calculation(calc, dialog)),
+            ("growth calculation", lambda: self.populate_growth_calculation(calc, result, dialog)),
+            ("WACC calculation", lambda: self.populate_wacc_calculation(calc, result, dialog)),
+            ("DCF steps", lambda: self.populate_dcf_steps(result, dialog)),
+            ("assumptions", lambda: self.populate_assumptions(result, dialog)),
+        ])
+    
+    def populate_raw_financial_data(self, calc, dialog):
+        """Populate raw financial statements"""
+        self._populate_statement(calc.cashflow, dialog.cashflow_table, _CASHFLOW_ITEMS,
+                                 _CASHFLOW_KEYWORDS, 3, "Cash flow data not available")
+        self._populate_statement(calc.balance_sheet, dialog.balance_sheet_table, _BALANCE_SHEET_ITEMS,
+                                 _BALANCE_SHEET_KEYWORDS, 4, "Balance sheet data not available")
+        self._populate_statement(calc.financials, dialog.income_table, _INCOME_ITEMS,
+                                 _INCOME_KEYWORDS, 4, "Income statement data not available")
+    
+    def _populate_statement(self, df, table, key_items, keyword_patterns, min_items, empty_message):
+        """Fill a raw statement table with its key line items for the latest four periods"""
+        if df is None or len(df.columns) == 0:
+            return
+        
+        # First try exact matches
+        available_items = [item for item in key_items if item in df.index]
+        
+        # If we don't have enough items, search by keywords in index names
+        if len(available_items) < min_items:
+            add_keyword_matches(df.index, keyword_patterns, available_items)
+            # Limit to 8 most relevant items
+            available_items = available_items[:8]
+        
+        if not available_items:
+            # Show message if no data found
+            table.model().set_rows([(empty_message,)], headers=["Message"])
+            return
+        
+        # First column is "Item", rest are years
+        block = df.iloc[:, :min(4, len(df.columns))]
+        headers = ["Item"] + period_labels(block.columns)
+        
+        # Format the visible block in one pass (duplicate labels keep their first row)
+        block = block[~block.index.duplicated()].reindex(available_items)
+        values = format_money_array(block.apply(pd.to_numeric, errors='coerce')).tolist()
+        
+        rows = []
+        styles = {}
+        for row, item in enumerate(available_items):
+            item_name = str(item)
+            # Truncate item name if too long, but show full name on hover
+            display_name = item_name[:40] + "..." if len(item_name) > 40 else item_name
+            styles[(row, 0)] = CellStyle(tooltip=item_name)
+            rows.append([display_name] + values[row])
+        table.model().set_rows(rows, headers=headers, styles=styles)
     
     def populate_fcf_calculation(self, calc, dialog):
         """Show FCF calculation breakdown with actual numbers per year"""
         fcf_history = calc.get_free_cash_flow(years=5)
         
-        dialog.fcf_calc_table.setColumnCount(5)
-        dialog.fcf_calc_table.setHorizontalHeaderLabels(["Year", "Operating CF", "Capital Expenditures", "FCF Calculation", "FCF Result"])
-        dialog.fcf_calc_table.horizontalHeader().setVisible(True)
-        dialog.fcf_calc_table.verticalHeader().setVisible(False)
-        
         if len(fcf_history) > 0:
-            dialog.fcf_calc_table.setRowCount(len(fcf_history) + 1)
+            rows = []
+            # Currency columns are right-aligned on every year row, set up front
+            styles = {(idx, col): RIGHT_ALIGNED for idx in range(len(fcf_history)) for col in (1, 2, 4)}
             
-            # Get actual operating CF and capex for each year
-            for idx, (date, fcf) in enumerate(fcf_history.items()):
-                year = str(date)[:4] if hasattr(date, 'year') else str(date)
-                dialog.fcf_calc_table.setItem(idx, 0, QTableWidgetItem(year))
-                
-                # Get actual values for this specific year/date
-                operating_cf = None
-                capex = None
-                
-                if calc.cashflow is not None and len(calc.cashflow.columns) > idx:
-                    # Try to find operating cash flow for this year
-                    for key in ['Operating Cash Flow', 'Total Cash From Operating Activities']:
-                        if key in calc.cashflow.index:
-                            try:
-                                operating_cf = calc.cashflow.loc[key].iloc[idx]
-                            except:
-                                pass
-                            break
-                    
-                    # Try to find capex for this year
-                    for key in ['Capital Expenditure', 'Capital Expenditures']:
-                        if key in calc.cashflow.index:
-                            try:
-                                capex = calc.cashflow.loc[key].iloc[idx]
-                            except:
-                                pass
-                            break
-                
-                # If not found, try alternative method - search by date
-                if operating_cf is None or pd.isna(operating_cf):
-                    for key in ['Operating Cash Flow', 'Total Cash From Operating Activities']:
-                        if key in calc.cashflow.index:
-                            series = calc.cashflow.loc[key]
-                            if date in series.index:
-                                operating_cf = series[date]
-                                break
-                            elif len(series) > idx:
-                                operating_cf = series.iloc[idx]
-                                break
-                
-                if capex is None or pd.isna(capex):
-                    for key in ['Capital Expenditure', 'Capital Expenditures']:
-                        if key in calc.cashflow.index:
-                            series = calc.cashflow.loc[key]
-                            if date in series.index:
-                                capex = series[date]
-                                break
-                            elif len(series) > idx:
-                                capex = series.iloc[idx]
-                                break
-                
-                # Display actual values
-                if pd.notna(operating_cf) and operating_cf is not None:
-                    opcf_item = QTableWidgetItem(self.format_currency_table(operating_cf))
-                    opcf_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    dialog.fcf_calc_table.setItem(idx, 1, opcf_item)
-                else:
-                    na_item = QTableWidgetItem("N/A")
-                    na_item.setTextAlignment(Qt.AlignCenter)
-                    dialog.fcf_calc_table.setItem(idx, 1, na_item)
-                
-                if pd.notna(capex) and capex is not None:
-                    # Capex is usually negative, show as positive in display
-                    capex_item = QTableWidgetItem(self.format_currency_table(abs(capex)))
-                    capex_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    dialog.fcf_calc_table.setItem(idx, 2, capex_item)
-                else:
-                    na_item = QTableWidgetItem("N/A")
-                    na_item.setTextAlignment(Qt.AlignCenter)
-                    dialog.fcf_calc_table.setItem(idx, 2, na_item)
-                
+            # Operating CF and capex for every FCF year, looked up once per statement row
+            operating_cfs = aligned_statement_row(
+                calc.cashflow, ('Operating Cash Flow', 'Total Cash From Operating Activities'), fcf_history.index)
+            capexes = aligned_statement_row(
+                calc.cashflow, ('Capital Expenditure', 'Capital Expenditures'), fcf_history.index)
+            
+            # Display actual values (N/A where missing); capex is usually negative, shown as positive
+            opcf_texts = format_money_array(operating_cfs).tolist()
+            capex_texts = format_money_array(np.abs(capexes)).tolist()
+            # Both inputs present, checked once for every year
+            has_inputs = (~np.isnan(operating_cfs) & ~np.isnan(capexes)).tolist()
+            
+            for year, opcf_text, capex_text, has_both, fcf in zip(
+                    period_labels(fcf_history.index), opcf_texts, capex_texts, has_inputs, fcf_history.tolist()):
                 # Show calculation
-                if pd.notna(operating_cf) and pd.notna(capex):
-                    calc_str = f"{self.format_currency_table(operating_cf)} - {self.format_currency_table(abs(capex))}"
-                else:
-                    calc_str = "Operating CF - CapEx"
+                calc_str = f"{opcf_text} - {capex_text}" if has_both else "Operating CF - CapEx"
                 
-                dialog.fcf_calc_table.setItem(idx, 3, QTableWidgetItem(calc_str))
-                dialog.fcf_calc_table.setItem(idx, 4, QTableWidgetItem(self.format_currency_table(fcf)))
-                
-                # Right-align currency columns
-                for col in [1, 2, 4]:
-                    item = dialog.fcf_calc_table.item(idx, col)
-                    if item:
-                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                rows.append((year, opcf_text, capex_text, calc_str, self.format_currency_table(fcf)))
             
             # Current FCF row (highlighted)
-            current_fcf = fcf_history.iloc[0]
+            current_fcf = fcf_history.iat[0]
             row = len(fcf_history)
-            dialog.fcf_calc_table.setItem(row, 0, QTableWidgetItem("Current (Most Recent)"))
-            dialog.fcf_calc_table.setItem(row, 1, QTableWidgetItem(""))
-            dialog.fcf_calc_table.setItem(row, 2, QTableWidgetItem(""))
-            dialog.fcf_calc_table.setItem(row, 3, QTableWidgetItem("Used for projections"))
-            item = QTableWidgetItem(self.format_currency_table(current_fcf))
-            item.setFont(QFont("", 9, QFont.Bold))
-            item.setBackground(QColor(230, 230, 255))
-            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            dialog.fcf_calc_table.setItem(row, 4, item)
+            rows.append(("Current (Most Recent)", "", "", "Used for projections",
+                         self.format_currency_table(current_fcf)))
+            styles[(row, 4)] = CellStyle(bold=True, background=RESULT_BLUE, alignment=ALIGN_RIGHT)
+            dialog.fcf_calc_table.model().set_rows(rows, styles=styles)
     
     def populate_growth_calculation(self, calc, result, dialog):
         """Show growth rate calculation breakdown with actual FCF values"""
         fcf_history = calc.get_free_cash_flow(years=5)
         growth_rate = result['growth_rate']
         
-        dialog.growth_calc_table.setColumnCount(5)
-        dialog.growth_calc_table.setHorizontalHeaderLabels(["Year", "FCF (Year N)", "FCF (Year N-1)", "Growth Calculation", "Growth Rate"])
-        dialog.growth_calc_table.horizontalHeader().setVisible(True)
-        dialog.growth_calc_table.verticalHeader().setVisible(False)
-        
         if len(fcf_history) >= 2:
-            rows = []
-            fcf_items = list(fcf_history.items())
-            fcf_values = fcf_history.values
+            # Year-over-year growth for every adjacent pair at once (newest first)
+            values = fcf_history.to_numpy(dtype=np.float64)
+            years = period_labels(fcf_history.index)
+            current, previous = values[:-1], values[1:]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                growth = (current - previous) / np.abs(previous)
+            current_text = format_money_array(current).tolist()
+            previous_text = format_money_array(previous).tolist()
+            divisor_text = format_money_array(np.abs(previous)).tolist()
             
-            for i in range(len(fcf_values) - 1):
-                year1_val = fcf_values[i]
-                year2_val = fcf_values[i + 1]
-                year1_date = fcf_items[i][0]
-                year2_date = fcf_items[i + 1][0]
-                
-                year1_str = str(year1_date)[:4] if hasattr(year1_date, 'year') else str(year1_date)[:4]
-                year2_str = str(year2_date)[:4] if hasattr(year2_date, 'year') else str(year2_date)[:4]
-                
-                if year2_val != 0 and not pd.isna(year2_val):
-                    growth = (year1_val - year2_val) / abs(year2_val)
-                    calc_str = f"({self.format_currency_table(year1_val)} - {self.format_currency_table(year2_val)}) / {self.format_currency_table(abs(year2_val))}"
-                    rows.append((f"{year1_str} vs {year2_str}", year1_val, year2_val, calc_str, growth))
-            
-            dialog.growth_calc_table.setRowCount(len(rows) + 1)
-            
-            for idx, (year_pair, y1, y2, calc_str, growth) in enumerate(rows):
-                dialog.growth_calc_table.setItem(idx, 0, QTableWidgetItem(year_pair))
-                y1_item = QTableWidgetItem(self.format_currency_table(y1))
-                y1_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                dialog.growth_calc_table.setItem(idx, 1, y1_item)
-                y2_item = QTableWidgetItem(self.format_currency_table(y2))
-                y2_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                dialog.growth_calc_table.setItem(idx, 2, y2_item)
-                dialog.growth_calc_table.setItem(idx, 3, QTableWidgetItem(calc_str))
-                growth_item = QTableWidgetItem(f"{growth*100:.2f}%")
-                growth_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                dialog.growth_calc_table.setItem(idx, 4, growth_item)
+            # Pairs whose earlier year is zero or missing have no growth rate
+            table_rows = [
+                (f"{years[i]} vs {years[i + 1]}", current_text[i], previous_text[i],
+                 f"({current_text[i]} - {previous_text[i]}) / {divisor_text[i]}",
+                 f"{growth[i]*100:.2f}%")
+                for i in np.flatnonzero((previous != 0) & ~np.isnan(previous)).tolist()
+            ]
+            styles = {(row, col): RIGHT_ALIGNED for row in range(len(table_rows)) for col in (1, 2, 4)}
             
             # Average/CAGR result
-            result_row = len(rows)
-            dialog.growth_calc_table.setItem(result_row, 0, QTableWidgetItem("Final Growth Rate"))
-            dialog.growth_calc_table.setItem(result_row, 1, QTableWidgetItem(""))
-            dialog.growth_calc_table.setItem(result_row, 2, QTableWidgetItem(""))
-            dialog.growth_calc_table.setItem(result_row, 3, QTableWidgetItem("Average of above growth rates"))
-            item = QTableWidgetItem(f"{growth_rate*100:.2f}%")
-            item.setFont(QFont("", 9, QFont.Bold))
-            item.setBackground(QColor(230, 255, 230))
-            item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            dialog.growth_calc_table.setItem(result_row, 4, item)
+            result_row = len(table_rows)
+            table_rows.append(("Final Growth Rate", "", "", "Average of above growth rates",
+                               f"{growth_rate*100:.2f}%"))
+            styles[(result_row, 4)] = CellStyle(bold=True, background=RESULT_GREEN, alignment=ALIGN_RIGHT)
+            dialog.growth_calc_table.model().set_rows(table_rows, styles=styles)
         else:
             # Not enough data - show message
-            dialog.growth_calc_table.setRowCount(1)
-            dialog.growth_calc_table.setItem(0, 0, QTableWidgetItem("Insufficient data"))
-            dialog.growth_calc_table.setItem(0, 1, QTableWidgetItem("Need at least 2 years of FCF data"))
-            dialog.growth_calc_table.setItem(0, 2, QTableWidgetItem(""))
-            dialog.growth_calc_table.setItem(0, 3, QTableWidgetItem(""))
-            dialog.growth_calc_table.setItem(0, 4, QTableWidgetItem(""))
+            dialog.growth_calc_table.model().set_rows(
+                [("Insufficient data", "Need at least 2 years of FCF data", "", "", "")])
     
     def populate_wacc_calculation(self, calc, result, dialog):
         """Show WACC calculation breakdown with actual numbers"""
@@ -1403,17 +1308,18 @@ class DCFApp(QMainWindow):
         current_debt = 0
         interest_expense = 0
         
-        if calc.balance_sheet is not None and len(calc.balance_sheet.columns) > 0:
-            if 'Total Debt' in calc.balance_sheet.index:
-                total_debt = calc.balance_sheet.loc['Total Debt'].iloc[0] if pd.notna(calc.balance_sheet.loc['Total Debt'].iloc[0]) else 0
-            elif 'Long Term Debt' in calc.balance_sheet.index and 'Current Debt' in calc.balance_sheet.index:
-                long_term_debt = calc.balance_sheet.loc['Long Term Debt'].iloc[0] if pd.notna(calc.balance_sheet.loc['Long Term Debt'].iloc[0]) else 0
-                current_debt = calc.balance_sheet.loc['Current Debt'].iloc[0] if pd.notna(calc.balance_sheet.loc['Current Debt'].iloc[0]) else 0
+        balance_sheet = calc.balance_sheet
+        if balance_sheet is not None and len(balance_sheet.columns) > 0:
+            bs_index = balance_sheet.index
+            if 'Total Debt' in bs_index:
+                total_debt = latest_statement_value(balance_sheet, 'Total Debt')
+            elif 'Long Term Debt' in bs_index and 'Current Debt' in bs_index:
+                long_term_debt = latest_statement_value(balance_sheet, 'Long Term Debt')
+                current_debt = latest_statement_value(balance_sheet, 'Current Debt')
                 total_debt = long_term_debt + current_debt
         
         if calc.financials is not None and len(calc.financials.columns) > 0:
-            if 'Interest Expense' in calc.financials.index:
-                interest_expense = abs(calc.financials.loc['Interest Expense'].iloc[0]) if pd.notna(calc.financials.loc['Interest Expense'].iloc[0]) else 0
+            interest_expense = abs(latest_statement_value(calc.financials, 'Interest Expense'))
         
         cost_of_debt = (interest_expense / total_debt) if total_debt > 0 else 0.05
         enterprise_value = market_cap + total_debt
@@ -1431,126 +1337,123 @@ class DCFApp(QMainWindow):
         after_tax_cost_debt = cost_of_debt * (1 - tax_rate)
         calculated_wacc = (equity_weight * cost_of_equity) + (debt_weight * after_tax_cost_debt)
         
+        # Each figure appears in several formula strings; format it once
+        price_text = self.format_currency_table(current_price)
+        market_cap_text = self.format_currency_table(market_cap)
+        debt_text = self.format_currency_table(total_debt)
+        interest_text = self.format_currency_table(interest_expense)
+        ev_text = self.format_currency_table(enterprise_value)
+        rf_pct = f"{risk_free_rate*100:.2f}%"
+        mrp_pct = f"{market_risk_premium*100:.2f}%"
+        re_pct = f"{cost_of_equity*100:.2f}%"
+        rd_pct = f"{cost_of_debt*100:.2f}%"
+        tax_pct = f"{tax_rate*100:.2f}%"
+        after_tax_rd_pct = f"{after_tax_cost_debt*100:.2f}%"
+        equity_pct = f"{equity_weight*100:.2f}%"
+        debt_pct = f"{debt_weight*100:.2f}%"
+        beta_text = f"{beta:.2f}"
+        
         wacc_data = [
-            ("Stock Price", self.format_currency_table(current_price), f"Current market price per share"),
+            ("Stock Price", price_text, "Current market price per share"),
             ("Shares Outstanding", f"{shares_outstanding:,.0f}", "Total number of shares"),
-            ("Market Cap (E)", self.format_currency_table(market_cap), f"Price × Shares = {current_price:,.2f} × {shares_outstanding:,.0f}"),
+            ("Market Cap (E)", market_cap_text, f"Price × Shares = {current_price:,.2f} × {shares_outstanding:,.0f}"),
             ("", "", ""),
-            ("Beta (β)", f"{beta:.2f}", f"From stock data - volatility measure"),
-            ("Risk-Free Rate (Rf)", f"{risk_free_rate*100:.2f}%", "10-year Treasury yield (assumed)"),
-            ("Market Risk Premium", f"{market_risk_premium*100:.2f}%", "Expected market return - Risk-free rate (assumed)"),
-            ("Cost of Equity (Re)", f"{cost_of_equity*100:.2f}%", f"Re = Rf + β × MRP = {risk_free_rate*100:.2f}% + {beta:.2f} × {market_risk_premium*100:.2f}%"),
+            ("Beta (β)", beta_text, "From stock data - volatility measure"),
+            ("Risk-Free Rate (Rf)", rf_pct, "10-year Treasury yield (assumed)"),
+            ("Market Risk Premium", mrp_pct, "Expected market return - Risk-free rate (assumed)"),
+            ("Cost of Equity (Re)", re_pct, f"Re = Rf + β × MRP = {rf_pct} + {beta_text} × {mrp_pct}"),
             ("", "", ""),
-            ("Interest Expense", self.format_currency_table(interest_expense), "From most recent income statement"),
-            ("Total Debt (D)", self.format_currency_table(total_debt), "From balance sheet (current + long-term)"),
-            ("Cost of Debt (Rd)", f"{cost_of_debt*100:.2f}%", f"Rd = Interest / Debt = {self.format_currency_table(interest_expense)} / {self.format_currency_table(total_debt)}"),
-            ("Tax Rate (Tc)", f"{tax_rate*100:.2f}%", "Corporate tax rate from stock data"),
-            ("After-Tax Cost of Debt", f"{after_tax_cost_debt*100:.2f}%", f"Rd × (1 - Tc) = {cost_of_debt*100:.2f}% × (1 - {tax_rate*100:.2f}%)"),
+            ("Interest Expense", interest_text, "From most recent income statement"),
+            ("Total Debt (D)", debt_text, "From balance sheet (current + long-term)"),
+            ("Cost of Debt (Rd)", rd_pct, f"Rd = Interest / Debt = {interest_text} / {debt_text}"),
+            ("Tax Rate (Tc)", tax_pct, "Corporate tax rate from stock data"),
+            ("After-Tax Cost of Debt", after_tax_rd_pct, f"Rd × (1 - Tc) = {rd_pct} × (1 - {tax_pct})"),
             ("", "", ""),
-            ("Enterprise Value (V)", self.format_currency_table(enterprise_value), f"V = E + D = {self.format_currency_table(market_cap)} + {self.format_currency_table(total_debt)}"),
-            ("Equity Weight (E/V)", f"{equity_weight*100:.2f}%", f"E/V = {self.format_currency_table(market_cap)} / {self.format_currency_table(enterprise_value)}"),
-            ("Debt Weight (D/V)", f"{debt_weight*100:.2f}%", f"D/V = {self.format_currency_table(total_debt)} / {self.format_currency_table(enterprise_value)}"),
+            ("Enterprise Value (V)", ev_text, f"V = E + D = {market_cap_text} + {debt_text}"),
+            ("Equity Weight (E/V)", equity_pct, f"E/V = {market_cap_text} / {ev_text}"),
+            ("Debt Weight (D/V)", debt_pct, f"D/V = {debt_text} / {ev_text}"),
             ("", "", ""),
-            ("WACC Calculation", f"{wacc*100:.2f}%", f"WACC = (E/V × Re) + (D/V × Rd × (1-Tc))"),
-            ("Formula Breakdown", "", f"= ({equity_weight*100:.2f}% × {cost_of_equity*100:.2f}%) + ({debt_weight*100:.2f}% × {after_tax_cost_debt*100:.2f}%)"),
-            ("Calculated WACC", f"{calculated_wacc*100:.2f}%", f"= ({equity_weight:.4f} × {cost_of_equity*100:.2f}%) + ({debt_weight:.4f} × {after_tax_cost_debt*100:.2f}%)"),
+            ("WACC Calculation", f"{wacc*100:.2f}%", "WACC = (E/V × Re) + (D/V × Rd × (1-Tc))"),
+            ("Formula Breakdown", "", f"= ({equity_pct} × {re_pct}) + ({debt_pct} × {after_tax_rd_pct})"),
+            ("Calculated WACC", f"{calculated_wacc*100:.2f}%", f"= ({equity_weight:.4f} × {re_pct}) + ({debt_weight:.4f} × {after_tax_rd_pct})"),
         ]
         
-        dialog.wacc_calc_table.setColumnCount(3)
-        dialog.wacc_calc_table.setHorizontalHeaderLabels(["Component", "Value", "Explanation"])
-        # Ensure headers are visible
-        dialog.wacc_calc_table.horizontalHeader().setVisible(True)
-        dialog.wacc_calc_table.verticalHeader().setVisible(False)
-        dialog.wacc_calc_table.setRowCount(len(wacc_data))
-        
-        for row, (component, value, explanation) in enumerate(wacc_data):
-            dialog.wacc_calc_table.setItem(row, 0, QTableWidgetItem(component))
-            dialog.wacc_calc_table.setItem(row, 1, QTableWidgetItem(value))
-            dialog.wacc_calc_table.setItem(row, 2, QTableWidgetItem(explanation))
-            
-            if "WACC" in component or "Calculated WACC" in component:
-                for col in range(3):
-                    item = dialog.wacc_calc_table.item(row, col)
-                    if item:
-                        item.setFont(QFont("", 9, QFont.Bold))
-                        item.setBackground(QColor(230, 255, 230))
+        highlight = CellStyle(bold=True, background=RESULT_GREEN)
+        styles = {(row, col): highlight
+                  for row, (component, *_) in enumerate(wacc_data) if "WACC" in component
+                  for col in range(3)}
+        dialog.wacc_calc_table.model().set_rows(wacc_data, styles=styles)
     
     def populate_dcf_steps(self, result, dialog):
         """Show step-by-step DCF calculation"""
+        # Figures that recur across the steps are formatted once
+        projected = result['projected_fcf']
+        years = len(projected)
+        discounted_total_text = self.format_currency_table(result['discounted_arr'].sum())
+        tv_text = self.format_currency_table(result['terminal_value'])
+        dtv_text = self.format_currency_table(result['discounted_terminal_value'])
+        ev_text = self.format_currency_table(result['enterprise_value'])
+        equity_text = self.format_currency_table(result['equity_value'])
+        wacc_pct = f"{result['discount_rate']*100:.2f}%"
+        terminal_pct = f"{result['terminal_growth_rate']*100:.2f}%"
+        
         steps_data = [
-            ("Step 1", "Project Future FCFs", f"Current FCF × (1 + Growth Rate)^year for 10 years", ""),
+            ("Step 1", "Project Future FCFs", "Current FCF × (1 + Growth Rate)^year for 10 years", ""),
             ("", "", f"Starting FCF: {self.format_currency_table(result['current_fcf'])}", ""),
             ("", "", f"Growth Rate: {result['growth_rate']*100:.2f}%", ""),
             ("", "", "", ""),
             ("Step 2", "Discount to Present Value", "Divide each year's FCF by (1 + WACC)^year", ""),
-            ("", "", f"Discount Rate (WACC): {result['discount_rate']*100:.2f}%", ""),
+            ("", "", f"Discount Rate (WACC): {wacc_pct}", ""),
             ("", "", "", ""),
         ]
         
-        # Add projection details
-        for year_data in result['projected_fcf'][:3]:  # Show first 3 years
-            year = year_data['year']
-            fcf = year_data['fcf']
-            discounted = year_data['discounted_fcf']
-            steps_data.append(("", f"Year {year}", 
-                             f"FCF: {self.format_currency_table(fcf)}, Discounted: {self.format_currency_table(discounted)}", ""))
+        # Add projection details for the first 3 years
+        steps_data += [
+            ("", f"Year {year_data['year']}",
+             f"FCF: {self.format_currency_table(year_data['fcf'])}, Discounted: {self.format_currency_table(year_data['discounted_fcf'])}", "")
+            for year_data in projected[:3]
+        ]
         
         steps_data.extend([
             ("", "...", "...", ""),
             ("", "", "", ""),
             ("Step 3", "Sum Discounted FCFs", 
-             f"Total: {self.format_currency_table(sum([y['discounted_fcf'] for y in result['projected_fcf']]))}", ""),
+             f"Total: {discounted_total_text}", ""),
             ("", "", "", ""),
             ("Step 4", "Calculate Terminal Value", 
-             f"(Final Year FCF × (1 + Terminal Growth)) / (WACC - Terminal Growth)", ""),
+             "(Final Year FCF × (1 + Terminal Growth)) / (WACC - Terminal Growth)", ""),
             ("", "", 
-             f"= ({self.format_currency_table(result['projected_fcf'][-1]['fcf'])} × (1 + {result['terminal_growth_rate']*100:.2f}%)) / ({result['discount_rate']*100:.2f}% - {result['terminal_growth_rate']*100:.2f}%)", ""),
-            ("", "", f"Terminal Value: {self.format_currency_table(result['terminal_value'])}", ""),
+             f"= ({self.format_currency_table(projected[-1]['fcf'])} × (1 + {terminal_pct})) / ({wacc_pct} - {terminal_pct})", ""),
+            ("", "", f"Terminal Value: {tv_text}", ""),
             ("", "", "", ""),
             ("Step 5", "Discount Terminal Value", 
-             f"Terminal Value / (1 + WACC)^{len(result['projected_fcf'])}", ""),
+             f"Terminal Value / (1 + WACC)^{years}", ""),
             ("", "", 
-             f"= {self.format_currency_table(result['terminal_value'])} / (1 + {result['discount_rate']*100:.2f}%)^{len(result['projected_fcf'])}", ""),
-            ("", "", f"Discounted Terminal Value: {self.format_currency_table(result['discounted_terminal_value'])}", ""),
+             f"= {tv_text} / (1 + {wacc_pct})^{years}", ""),
+            ("", "", f"Discounted Terminal Value: {dtv_text}", ""),
             ("", "", "", ""),
             ("Step 6", "Calculate Enterprise Value", 
-             f"Sum of Discounted FCFs + Discounted Terminal Value", ""),
+             "Sum of Discounted FCFs + Discounted Terminal Value", ""),
             ("", "", 
-             f"= {self.format_currency_table(sum([y['discounted_fcf'] for y in result['projected_fcf']]))} + {self.format_currency_table(result['discounted_terminal_value'])}", ""),
-            ("", "", f"Enterprise Value: {self.format_currency_table(result['enterprise_value'])}", ""),
+             f"= {discounted_total_text} + {dtv_text}", ""),
+            ("", "", f"Enterprise Value: {ev_text}", ""),
             ("", "", "", ""),
             ("Step 7", "Calculate Equity Value", 
-             f"Enterprise Value - Net Debt", ""),
+             "Enterprise Value - Net Debt", ""),
             ("", "", 
-             f"= {self.format_currency_table(result['enterprise_value'])} - {self.format_currency_table(result['net_debt'])}", ""),
-            ("", "", f"Equity Value: {self.format_currency_table(result['equity_value'])}", ""),
+             f"= {ev_text} - {self.format_currency_table(result['net_debt'])}", ""),
+            ("", "", f"Equity Value: {equity_text}", ""),
             ("", "", "", ""),
             ("Step 8", "Value Per Share", 
-             f"Equity Value / Shares Outstanding", ""),
+             "Equity Value / Shares Outstanding", ""),
             ("", "", 
-             f"= {self.format_currency_table(result['equity_value'])} / {result['shares_outstanding']:,.0f}", ""),
+             f"= {equity_text} / {result['shares_outstanding']:,.0f}", ""),
             ("", "", f"Value Per Share: {self.format_currency_table(result['per_share_value'])}", ""),
         ])
         
-        dialog.dcf_steps_table.setColumnCount(4)
-        dialog.dcf_steps_table.setHorizontalHeaderLabels(["Step", "Description", "Calculation", ""])
-        # Ensure headers are visible
-        dialog.dcf_steps_table.horizontalHeader().setVisible(True)
-        dialog.dcf_steps_table.verticalHeader().setVisible(False)
-        dialog.dcf_steps_table.setRowCount(len(steps_data))
-        
-        for row, (step, desc, calc, extra) in enumerate(steps_data):
-            if step:
-                item = QTableWidgetItem(step)
-                item.setFont(QFont("", 9, QFont.Bold))
-                item.setBackground(QColor(240, 240, 255))
-                dialog.dcf_steps_table.setItem(row, 0, item)
-            else:
-                dialog.dcf_steps_table.setItem(row, 0, QTableWidgetItem(""))
-            
-            dialog.dcf_steps_table.setItem(row, 1, QTableWidgetItem(desc if desc else ""))
-            dialog.dcf_steps_table.setItem(row, 2, QTableWidgetItem(calc if calc else ""))
-            dialog.dcf_steps_table.setItem(row, 3, QTableWidgetItem(extra if extra else ""))
+        step_style = CellStyle(bold=True, background=STEP_BLUE)
+        styles = {(row, 0): step_style for row, (step, *_) in enumerate(steps_data) if step}
+        dialog.dcf_steps_table.model().set_rows(steps_data, styles=styles)
     
     def populate_assumptions(self, result, dialog):
         """Show all assumptions used"""
@@ -1567,17 +1470,7 @@ class DCFApp(QMainWindow):
             ("Currency", "USD", "All values in US Dollars"),
         ]
         
-        dialog.assumptions_table.setColumnCount(3)
-        dialog.assumptions_table.setHorizontalHeaderLabels(["Assumption", "Value", "Note"])
-        # Ensure headers are visible
-        dialog.assumptions_table.horizontalHeader().setVisible(True)
-        dialog.assumptions_table.verticalHeader().setVisible(False)
-        dialog.assumptions_table.setRowCount(len(assumptions_data))
-        
-        for row, (assumption, value, note) in enumerate(assumptions_data):
-            dialog.assumptions_table.setItem(row, 0, QTableWidgetItem(assumption))
-            dialog.assumptions_table.setItem(row, 1, QTableWidgetItem(value))
-            dialog.assumptions_table.setItem(row, 2, QTableWidgetItem(note))
+        dialog.assumptions_table.model().set_rows(assumptions_data)
     
     def on_calculation_error(self, error_msg):
         """Display error message"""
@@ -1589,20 +1482,36 @@ class DCFApp(QMainWindow):
         QMessageBox.critical(self, "Calculation Error", f"Unable to calculate DCF:\n\n{error_display}")
         
         # Clear tables
-        self.summary_table.setRowCount(0)
-        self.projections_table.setRowCount(0)
-        self.valuation_table.setRowCount(0)
+        for table in (self.summary_table, self.projections_table, self.valuation_table):
+            table.model().clear()
+            table.setEnabled(True)
+        self._shown_inputs = None
         
         self.detailed_breakdown_btn.setVisible(False)
 
 
 def main():
     """Main entry point"""
+    # Merge bursts of move/resize/tablet events into one before they reach widgets
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
     app = QApplication(sys.argv)
     
     # Set application style
     app.setStyle('Fusion')
     
+    # No animated combo popups, menus or tooltips - they only add repaints
+    for effect in (Qt.UI_AnimateCombo, Qt.UI_AnimateMenu, Qt.UI_FadeMenu,
+                   Qt.UI_AnimateTooltip, Qt.UI_FadeTooltip, Qt.UI_AnimateToolBox):
+        app.setEffectEnabled(effect, False)
+    
+    # One application-wide alternate row brush shared by every table, and a
+    # larger pixmap cache (in KB) so rendered style pixmaps survive tab switches
+    palette = app.palette()
+    palette.setBrush(QPalette.AlternateBase, QBrush(QColor("#f4f6fa")))
+    app.setPalette(palette)
+    QPixmapCache.setCacheLimit(10240)
+    
     window = DCFApp()
     window.show()
     